@@ -2,29 +2,36 @@
 # backend/app.py
 # FastAPI backend for Floating Ideas (single-event)
 # - PIN-protected submissions
-# - CSV + JSON persistence
+# - CSV + NDJSON persistence (ideas.json kept as a snapshot)
 # - Header management
 # - Minimal HTML form at '/'
-# - WebSocket broadcast for live updates
+# - WebSocket broadcast for live updates (rapid submissions coalesced per tick)
 # ============================
 
 # ----------------------------
 # Imports
 # ----------------------------
 # Import typing tools for explicit type hints
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, TextIO, BinaryIO, Tuple, Union
 
 # Import standard library modules for filesystem and time
 from pathlib import Path
 from datetime import datetime
 import os
 import csv
-import json
+import hmac
+import hashlib
+import zlib
 import asyncio
+import threading
+from dataclasses import dataclass, field
+
+# Import orjson for fast (C-implemented) JSON encoding/decoding
+import orjson
 
 # Import FastAPI and Starlette components
-from fastapi import FastAPI, Form, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi import FastAPI, Form, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -40,18 +47,42 @@ DATA_DIR: Path = BASE_DIR / "data"
 # Define individual file paths for data persistence
 CSV_PATH: Path = DATA_DIR / "ideas.csv"
 JSON_PATH: Path = DATA_DIR / "ideas.json"
+NDJSON_PATH: Path = DATA_DIR / "ideas.ndjson"
 HEADER_PATH: Path = DATA_DIR / "header.txt"
 
 # Define default header question text
 DEFAULT_HEADER: str = "What ways can we use AI?"
 
+# Debounce window (seconds) before rewriting the ideas.json snapshot after inserts
+SNAPSHOT_DEBOUNCE_S: float = 0.5
+
+# Path to the static HTML intake form served at '/'
+SUBMIT_HTML_PATH: Path = Path(__file__).resolve().parent / "submit.html"
+
+# WebSocket messages up to this size go out as plain JSON text frames; larger ones are
+# zlib-compressed once per broadcast and sent as binary frames (per-message deflate is disabled).
+WS_COMPRESS_MIN_BYTES: int = 512
+WS_COMPRESS_LEVEL: int = 6
+
+# How often (seconds) the cached second-precision timestamp is refreshed
+CLOCK_TICK_S: float = 0.5
+
+# Coalescing window (seconds): during a burst, submissions arriving within it share one
+# write + broadcast (a lone submission is flushed immediately)
+FLUSH_INTERVAL_S: float = 0.05
+
 # Read the required event PIN from environment (set EVENT_PIN=1234 before running)
 EVENT_PIN: str = os.environ.get("EVENT_PIN", "").strip()
 
 
+# An outbound WebSocket frame: str is sent as a text frame, bytes as a binary frame
+WSFrame = Union[str, bytes]
+
+
 # ----------------------------
 # Data Models (Pydantic-like typing, simple dicts persisted to files)
 # ----------------------------
+@dataclass(slots=True)
 class Idea:
     """
     @brief  In-memory representation of an idea row.
@@ -59,16 +90,33 @@ class Idea:
     @field  author      Name of the submitter.
     @field  text        The idea text.
     @field  created_at  ISO timestamp (seconds precision).
+    @field  _d          Cached dict form (built once; ideas are immutable after creation).
     """
     id: int
     author: str
     text: str
     created_at: str
+    _d: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    # Comment-before-line: Build the serializable dict once at construction.
+    def __post_init__(self) -> None:
+        self._d = {"id": self.id, "author": self.author, "text": self.text, "created_at": self.created_at}
 
     # Comment-before-line: Provide a helper to convert Idea to plain dict for JSON/response.
     def to_dict(self) -> Dict[str, Any]:
-        # Convert the Idea instance to a serializable dictionary
-        return {"id": self.id, "author": self.author, "text": self.text, "created_at": self.created_at}
+        # Return the cached dictionary (do not mutate)
+        return self._d
+
+
+class FastJSONResponse(Response):
+    """
+    @brief  JSON response encoded with orjson (FastAPI's ORJSONResponse is deprecated).
+    """
+    media_type = "application/json"
+
+    # Comment-before-line: Serialize the content in one C call; orjson already emits UTF-8 bytes.
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
 
 
 # ----------------------------
@@ -77,12 +125,51 @@ class Idea:
 # Comment-before-line: Maintain a lightweight cache of ideas to minimize file I/O frequency.
 IDEAS_CACHE: List[Idea] = []
 
-# Comment-before-line: Keep a set of active WebSocket connections for broadcasting updates in real time.
-ACTIVE_SOCKETS: Set[WebSocket] = set()
+# Comment-before-line: Parallel list of cached idea dicts, kept in step with IDEAS_CACHE.
+IDEAS_DICTS: List[Dict[str, Any]] = []
+
+# Comment-before-line: Prebuilt JSON body for GET /ideas and /export.json (rebuilt on insert).
+IDEAS_JSON_BYTES: bytes = b"[]"
+
+# Comment-before-line: Active WebSocket clients, each with its bounded outbound queue and writer task.
+ACTIVE_CLIENTS: Dict[WebSocket, Tuple["asyncio.Queue[WSFrame]", "asyncio.Task[None]"]] = {}
 
-# Comment-before-line: Create a single asyncio lock to serialize file writes.
+# Comment-before-line: Immutable (socket, queue) snapshot for broadcast; rebuilt only on connect/disconnect.
+BROADCAST_TARGETS: Tuple[Tuple[WebSocket, "asyncio.Queue[WSFrame]"], ...] = ()
+
+# Comment-before-line: Create a single asyncio lock to serialize ID assignment + cache updates.
 WRITE_LOCK: asyncio.Lock = asyncio.Lock()
 
+# Comment-before-line: Thread lock serializing file writes done off the event loop.
+DISK_LOCK: threading.Lock = threading.Lock()
+
+# Comment-before-line: Cached intake form bytes + ETag and header text (loaded at startup).
+SUBMIT_HTML_BYTES: bytes = b""
+SUBMIT_ETAG: str = ""
+HEADER_CACHE: str = DEFAULT_HEADER
+
+# Comment-before-line: Long-lived append handles for the CSV and NDJSON logs (opened at startup).
+CSV_FILE: Optional[TextIO] = None
+NDJSON_FILE: Optional[BinaryIO] = None
+
+# Comment-before-line: Signals the background snapshotter that ideas.json is stale.
+SNAPSHOT_DIRTY: asyncio.Event = asyncio.Event()
+
+# Comment-before-line: Current local time as an ISO string (seconds), refreshed by the clock task.
+CURRENT_ISO: str = datetime.now().isoformat(timespec="seconds")
+
+# Comment-before-line: Startup tasks and socket closes (referenced so they aren't garbage-collected).
+BACKGROUND_TASKS: List["asyncio.Task[None]"] = []
+
+# Comment-before-line: Submissions (author, text, future) waiting for the next flush tick.
+PENDING: "asyncio.Queue[Tuple[str, str, asyncio.Future]]" = asyncio.Queue()
+
+# Comment-before-line: Max frames buffered per client; a client that falls this far behind is dropped.
+CLIENT_QUEUE_MAX: int = 64
+
+# Comment-before-line: Per-frame send timeout (seconds); slower clients are dropped.
+SEND_TIMEOUT_S: float = 5.0
+
 
 # ----------------------------
 # Utility Functions (declarations + definitions)
@@ -104,6 +191,13 @@ def ensure_data_files() -> None:
     if not JSON_PATH.exists():
         JSON_PATH.write_text("[]", encoding="utf-8")
 
+    # Initialize the NDJSON log, migrating any ideas from an older ideas.json
+    if not NDJSON_PATH.exists():
+        existing = orjson.loads(JSON_PATH.read_bytes())
+        with NDJSON_PATH.open("wb") as f:
+            for o in existing:
+                f.write(orjson.dumps(o) + b"\n")
+
     # Initialize header text file if missing
     if not HEADER_PATH.exists():
         HEADER_PATH.write_text(DEFAULT_HEADER, encoding="utf-8")
@@ -111,35 +205,72 @@ def ensure_data_files() -> None:
 
 def load_all_ideas_from_disk() -> List[Idea]:
     """
-    @brief  Load all ideas from JSON to memory (source of truth).
-    @return List of Idea objects loaded from ideas.json.
+    @brief  Load all ideas from the NDJSON log to memory (source of truth).
+    @return List of Idea objects loaded from ideas.ndjson.
     """
-    # Read JSON text from disk
-    raw = JSON_PATH.read_text(encoding="utf-8")
-    # Parse JSON content into Python objects
-    data = json.loads(raw)
+    # Join non-blank records into one JSON array so orjson parses the whole log in a single C call
+    lines = [ln for ln in NDJSON_PATH.read_bytes().splitlines() if ln.strip()]
+    data = orjson.loads(b"[" + b",".join(lines) + b"]")
     # Convert dicts to Idea instances
-    items: List[Idea] = []
-    for o in data:
-        it = Idea()
-        it.id = int(o["id"])
-        it.author = str(o["author"])
-        it.text = str(o["text"])
-        it.created_at = str(o["created_at"])
-        items.append(it)
+    items: List[Idea] = [
+        Idea(int(o["id"]), str(o["author"]), str(o["text"]), str(o["created_at"]))
+        for o in data
+    ]
     # Return parsed ideas
     return items
 
 
 def persist_full_json(ideas: List[Idea]) -> None:
     """
-    @brief  Write the full list of ideas back to JSON atomically.
+    @brief  Write a full snapshot of ideas to ideas.json (for export/archival).
     @param  ideas  The in-memory list to persist.
     """
     # Convert Idea objects to dictionaries
     payload = [i.to_dict() for i in ideas]
-    # Write JSON with pretty indent for readability
-    JSON_PATH.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Write JSON with pretty indent for readability (orjson emits UTF-8 bytes)
+    with DISK_LOCK:
+        JSON_PATH.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
+
+def open_append_logs() -> None:
+    """
+    @brief  Open the CSV and NDJSON logs once for appending (kept open for the process).
+    """
+    global CSV_FILE, NDJSON_FILE
+    # Line-buffered text handle so each CSV row reaches the OS immediately
+    CSV_FILE = CSV_PATH.open("a", newline="", encoding="utf-8", buffering=1)
+    # Binary handle for NDJSON records (flushed per write)
+    NDJSON_FILE = NDJSON_PATH.open("ab")
+
+
+def close_append_logs() -> None:
+    """
+    @brief  Flush and close the long-lived log handles.
+    """
+    for f in (CSV_FILE, NDJSON_FILE):
+        if f is not None and not f.closed:
+            f.close()
+
+
+def append_ndjson(idea: Idea) -> None:
+    """
+    @brief  Append a single idea to the NDJSON log (one record per line).
+    @param  idea  The Idea to append.
+    """
+    # Write the encoded record + newline on the open handle
+    NDJSON_FILE.write(orjson.dumps(idea.to_dict()) + b"\n")
+    NDJSON_FILE.flush()
+
+
+def csv_quote(value: str) -> str:
+    """
+    @brief  Quote a CSV field like csv.QUOTE_MINIMAL (RFC 4180 escaping).
+    @param  value  Raw field text.
+    @return Field text, wrapped in quotes with doubled inner quotes if needed.
+    """
+    if '"' in value or "," in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
 
 
 def append_csv_row(idea: Idea) -> None:
@@ -147,67 +278,167 @@ def append_csv_row(idea: Idea) -> None:
     @brief  Append a single idea to the CSV file.
     @param  idea  The Idea to append.
     """
-    # Open CSV in append mode and write the new row
-    with CSV_PATH.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([idea.id, idea.author, idea.text, idea.created_at])
+    # id is an int and created_at is ISO, so only author/text can need quoting
+    CSV_FILE.write(f"{idea.id},{csv_quote(idea.author)},{csv_quote(idea.text)},{idea.created_at}\r\n")
 
 
-def get_next_id(ideas: List[Idea]) -> int:
+def pin_matches(pin: str) -> bool:
     """
-    @brief  Compute the next auto-increment ID based on the current cache.
-    @param  ideas  The in-memory list of ideas.
-    @return Next integer ID.
+    @brief  Compare a submitted PIN to EVENT_PIN in constant time.
+    @param  pin  Raw PIN from the form (whitespace is trimmed).
+    @return True if the PIN matches.
     """
-    # If there are no ideas, start at 1, else current max id + 1
-    return (max((i.id for i in ideas), default=0) + 1)
+    # Compare as UTF-8 bytes so non-ASCII input can't raise
+    return hmac.compare_digest(pin.strip().encode("utf-8"), EVENT_PIN.encode("utf-8"))
 
 
-def read_header_text() -> str:
+def load_header_text() -> str:
     """
     @brief  Read the header text from disk.
-    @return Current header string (falls back to default).
+    @return Header string from header.txt (falls back to default).
     """
     # Return content of header file (or default if empty)
     txt = HEADER_PATH.read_text(encoding="utf-8").strip()
     return txt or DEFAULT_HEADER
 
 
+def persist_new_ideas(ideas: List[Idea]) -> None:
+    """
+    @brief  Append newly created ideas to the CSV and NDJSON logs.
+    @detail Blocking; run via asyncio.to_thread so the event loop keeps serving.
+    @param  ideas  Ideas to append, in ID order.
+    """
+    with DISK_LOCK:
+        for idea in ideas:
+            append_csv_row(idea)
+            append_ndjson(idea)
+
+
+def read_header_text() -> str:
+    """
+    @brief  Return the cached header text (kept in sync by write_header_text).
+    @return Current header string.
+    """
+    return HEADER_CACHE
+
+
 def write_header_text(value: str) -> None:
     """
     @brief  Overwrite the header text on disk.
     @param  value  The new header string to persist.
     """
-    # Write the provided header string to the header file
+    global HEADER_CACHE
+    # Refresh the in-memory copy, then write the header string to the header file
+    HEADER_CACHE = value.strip() or DEFAULT_HEADER
     HEADER_PATH.write_text(value.strip(), encoding="utf-8")
 
 
-async def broadcast(payload: Dict[str, Any]) -> None:
+async def client_writer(ws: WebSocket, queue: "asyncio.Queue[WSFrame]") -> None:
+    """
+    @brief  Per-client task: send queued frames in order until the socket fails.
+    @param  ws     Connected WebSocket.
+    @param  queue  This client's outbound frame queue.
+    """
+    try:
+        while True:
+            message = await queue.get()
+            send = ws.send_text if isinstance(message, str) else ws.send_bytes
+            await asyncio.wait_for(send(message), SEND_TIMEOUT_S)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Broken or too-slow socket: unregister and close
+        unregister_client(ws)
+        await close_client(ws)
+
+
+async def close_client(ws: WebSocket) -> None:
+    """
+    @brief  Close a dropped client's socket, ignoring errors from an already-dead connection.
+    @param  ws  WebSocket to close.
+    """
+    try:
+        await ws.close()
+    except Exception:
+        pass
+
+
+def register_client(ws: WebSocket) -> "asyncio.Queue[WSFrame]":
+    """
+    @brief  Add a client with its own outbound queue and writer task.
+    @param  ws  Accepted WebSocket.
+    @return The client's outbound queue.
+    """
+    global BROADCAST_TARGETS
+    queue: "asyncio.Queue[WSFrame]" = asyncio.Queue(maxsize=CLIENT_QUEUE_MAX)
+    ACTIVE_CLIENTS[ws] = (queue, asyncio.create_task(client_writer(ws, queue)))
+    BROADCAST_TARGETS = BROADCAST_TARGETS + ((ws, queue),)
+    return queue
+
+
+def unregister_client(ws: WebSocket) -> Optional["asyncio.Task[None]"]:
+    """
+    @brief  Remove a client from the registry and the broadcast snapshot.
+    @param  ws  WebSocket to remove.
+    @return The client's writer task, or None if it was already removed.
+    """
+    global BROADCAST_TARGETS
+    entry = ACTIVE_CLIENTS.pop(ws, None)
+    if entry is None:
+        return None
+    BROADCAST_TARGETS = tuple(t for t in BROADCAST_TARGETS if t[0] is not ws)
+    return entry[1]
+
+
+def drop_client(ws: WebSocket) -> None:
+    """
+    @brief  Unregister a client and stop its writer task (safe to call twice).
+    @param  ws  WebSocket to drop.
+    """
+    task = unregister_client(ws)
+    if task is not None:
+        task.cancel()
+
+
+def encode_frame(message: bytes) -> WSFrame:
+    """
+    @brief  Turn JSON bytes into a WebSocket frame, compressing large bodies.
+    @param  message  UTF-8 JSON bytes.
+    @return The JSON as text for small bodies, else the zlib-compressed JSON bytes.
+    """
+    if len(message) > WS_COMPRESS_MIN_BYTES:
+        return zlib.compress(message, WS_COMPRESS_LEVEL)
+    return message.decode("utf-8")
+
+
+def broadcast(payload: Dict[str, Any]) -> None:
     """
     @brief  Broadcast a JSON message to all connected WebSocket clients.
+    @detail Sent as text, or as compressed binary when large (see encode_frame).
+            Frames are queued per client (no network awaits here); clients whose
+            queue is full are dropped.
     @param  payload  The JSON-serializable message to send.
     """
-    # Convert payload to JSON string once for efficiency
-    message = json.dumps(payload)
-    # Iterate a snapshot of sockets to avoid mutation during iteration
-    targets = list(ACTIVE_SOCKETS)
-    # Send the message to each active client; drop broken sockets
-    for ws in targets:
+    # Encode (and compress, if large) once; every client gets the same frame
+    message = encode_frame(orjson.dumps(payload))
+    # Iterate the immutable snapshot (drops below rebind it, not mutate it)
+    for ws, queue in BROADCAST_TARGETS:
         try:
-            await ws.send_text(message)
-        except Exception:
-            # If sending fails, remove the socket from active set
-            try:
-                ACTIVE_SOCKETS.remove(ws)
-            except KeyError:
-                pass
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Client can't keep up: drop it rather than back-pressure everyone
+            drop_client(ws)
+            # Track the close until it finishes (the task removes itself when done)
+            task = asyncio.create_task(close_client(ws))
+            BACKGROUND_TASKS.append(task)
+            task.add_done_callback(BACKGROUND_TASKS.remove)
 
 
 # ----------------------------
 # FastAPI App Initialization
 # ----------------------------
-# Create FastAPI application instance
-app = FastAPI(title="Floating Ideas — Event Backend")
+# Create FastAPI application instance (orjson-backed responses by default)
+app = FastAPI(title="Floating Ideas — Event Backend", default_response_class=FastJSONResponse)
 
 # Enable permissive CORS so staff devices on local Wi‑Fi can post ideas
 app.add_middleware(
@@ -218,39 +449,178 @@ app.add_middleware(
     allow_headers=["*"],          # Allow all headers
 )
 
-# Ensure data files exist and warm the cache at startup
+# Ensure data files exist, warm the cache, and open the append logs at startup
 ensure_data_files()
 IDEAS_CACHE = load_all_ideas_from_disk()
+IDEAS_DICTS = [i.to_dict() for i in IDEAS_CACHE]
+IDEAS_JSON_BYTES = orjson.dumps(IDEAS_DICTS)
+open_append_logs()
+
+# Cache the intake form (with a content ETag) and header text so requests don't hit the disk
+SUBMIT_HTML_BYTES = SUBMIT_HTML_PATH.read_bytes()
+SUBMIT_ETAG = '"' + hashlib.blake2b(SUBMIT_HTML_BYTES, digest_size=16).hexdigest() + '"'
+HEADER_CACHE = load_header_text()
+
+# Seed the auto-increment counter once (IDs are monotonic; no per-POST scan)
+NEXT_ID: int = max((i.id for i in IDEAS_CACHE), default=0) + 1
+
+
+async def snapshotter() -> None:
+    """
+    @brief  Background task: rewrite ideas.json once per burst of inserts.
+    """
+    while True:
+        # Wait until a POST marks the snapshot stale
+        await SNAPSHOT_DIRTY.wait()
+        # Let a burst of submissions settle before writing once
+        await asyncio.sleep(SNAPSHOT_DEBOUNCE_S)
+        SNAPSHOT_DIRTY.clear()
+        # Write from a copy in a worker thread so the event loop isn't blocked
+        await asyncio.to_thread(persist_full_json, list(IDEAS_CACHE))
+
+
+async def flush_pending(batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+    """
+    @brief  Commit a batch of queued submissions at once and broadcast them as one frame.
+    @param  batch  Already-dequeued submissions; anything else waiting in PENDING is added.
+    @detail Assigns IDs and updates caches under WRITE_LOCK, re-encodes the ideas
+            JSON once, appends to CSV + NDJSON in a worker thread, resolves each
+            submitter's future, then sends 'idea.batch'. If the append fails the
+            batch is taken back out of the caches and nothing is broadcast.
+    """
+    global NEXT_ID, IDEAS_JSON_BYTES
+
+    # Drain everything else queued during the coalescing window
+    while not PENDING.empty():
+        batch.append(PENDING.get_nowait())
+
+    # Critical section: only ID assignment + in-memory cache updates
+    async with WRITE_LOCK:
+        created_at = CURRENT_ISO
+        created: List[Idea] = []
+        for author, text, _ in batch:
+            # Create the Idea object with the next ID and timestamp
+            new = Idea(id=NEXT_ID, author=author, text=text, created_at=created_at)
+            NEXT_ID += 1
+
+            # Append to in-memory caches
+            IDEAS_CACHE.append(new)
+            IDEAS_DICTS.append(new.to_dict())
+            created.append(new)
+
+        # Re-encode the cached /ideas response body once per batch
+        IDEAS_JSON_BYTES = orjson.dumps(IDEAS_DICTS)
+
+        # Mark the ideas.json snapshot stale; the snapshotter rewrites it debounced
+        SNAPSHOT_DIRTY.set()
+
+    # Persist to CSV + NDJSON logs (append only) off the event loop
+    try:
+        await asyncio.to_thread(persist_new_ideas, created)
+    except Exception as exc:
+        # Roll the batch back out of the caches so /ideas matches the logs
+        async with WRITE_LOCK:
+            failed_ids = {i.id for i in created}
+            IDEAS_CACHE[:] = [i for i in IDEAS_CACHE if i.id not in failed_ids]
+            IDEAS_DICTS[:] = [d for d in IDEAS_DICTS if d["id"] not in failed_ids]
+            IDEAS_JSON_BYTES = orjson.dumps(IDEAS_DICTS)
+            # Rewrite the snapshot in case it was taken while the batch was visible
+            SNAPSHOT_DIRTY.set()
+
+        # Report the failed write to the waiting submitters
+        for _, _, fut in batch:
+            if not fut.done():
+                fut.set_exception(exc)
+        return
+
+    # Release the waiting POST handlers with their created ideas
+    for (_, _, fut), new in zip(batch, created):
+        if not fut.done():
+            fut.set_result(new)
+
+    # Broadcast all new ideas to WebSocket clients in a single frame
+    broadcast({"type": "idea.batch", "data": [i.to_dict() for i in created]})
+
+
+async def clock_ticker() -> None:
+    """
+    @brief  Background task: refresh CURRENT_ISO so inserts don't format timestamps.
+    """
+    global CURRENT_ISO
+    while True:
+        CURRENT_ISO = datetime.now().isoformat(timespec="seconds")
+        await asyncio.sleep(CLOCK_TICK_S)
+
+
+async def flusher() -> None:
+    """
+    @brief  Background task: wake on the first queued submission and flush it,
+            waiting one coalescing window first only if others are already queued.
+    @detail A failed flush fails that batch's submitters and the loop keeps running,
+            so later POSTs are never left waiting on a dead task.
+    """
+    while True:
+        # Block (without polling) until a submission arrives
+        batch = [await PENDING.get()]
+        # More already waiting means a burst: give it a moment to pile up
+        if not PENDING.empty():
+            await asyncio.sleep(FLUSH_INTERVAL_S)
+        try:
+            await flush_pending(batch)
+        except Exception as exc:
+            # flush_pending drains PENDING into batch, so this covers every waiter
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+
+@app.on_event("startup")
+async def start_background_tasks() -> None:
+    """
+    @brief  Launch the clock, the submission flusher, and the debounced ideas.json snapshot task.
+    """
+    # Keep references so the tasks aren't garbage-collected while running
+    BACKGROUND_TASKS.extend(asyncio.create_task(c) for c in (clock_ticker(), flusher(), snapshotter()))
+
+
+@app.on_event("shutdown")
+def snapshot_on_shutdown() -> None:
+    """
+    @brief  Write a final ideas.json snapshot and close the append logs.
+    """
+    persist_full_json(IDEAS_CACHE)
+    close_append_logs()
 
 
 # ----------------------------
 # Routes: HTML Intake (minimal form)
 # ----------------------------
 @app.get("/", response_class=HTMLResponse)
-def intake_form() -> HTMLResponse:
+def intake_form(request: Request) -> Response:
     """
     @brief  Serve the minimal mobile-friendly HTML intake form.
-    @return HTMLResponse containing the contents of backend/submit.html.
+    @param  request  Incoming request (checked for If-None-Match).
+    @return 304 if the client's copy is current, else the cached submit.html bytes.
     """
-    # Compute path to embedded HTML file
-    html_path: Path = Path(__file__).resolve().parent / "submit.html"
-    # Read the file text (assumes you will add submit.html next)
-    html_text: str = html_path.read_text(encoding="utf-8")
-    # Return as HTML
-    return HTMLResponse(content=html_text)
+    headers = {"ETag": SUBMIT_ETAG, "Cache-Control": "public, max-age=60"}
+    # Let browsers revalidate reloads without re-downloading the page
+    if SUBMIT_ETAG in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    # Return the cached HTML
+    return HTMLResponse(content=SUBMIT_HTML_BYTES, headers=headers)
 
 
 # ----------------------------
 # Routes: Ideas CRUD (file-based)
 # ----------------------------
 @app.get("/ideas")
-def get_ideas() -> List[Dict[str, Any]]:
+def get_ideas() -> Response:
     """
     @brief  Return all ideas as a JSON list (used by wall and Streamlit).
-    @return List of idea dicts.
+    @return Response carrying the prebuilt JSON array bytes.
     """
-    # Convert the in-memory cache to plain dicts for response
-    return [i.to_dict() for i in IDEAS_CACHE]
+    # Serve the cached JSON body without re-serializing
+    return Response(IDEAS_JSON_BYTES, media_type="application/json")
 
 
 @app.post("/ideas")
@@ -258,54 +628,35 @@ async def post_idea(
     author: str = Form(...),
     text: str = Form(...),
     pin: str = Form(...),
-) -> JSONResponse:
+) -> FastJSONResponse:
     """
     @brief  Create a new idea after validating the event PIN.
     @param  author  Submitter's name (form field).
     @param  text    Idea text (form field).
     @param  pin     Event PIN (form field).
-    @return JSONResponse with ok flag and idea data or error.
+    @return FastJSONResponse with ok flag and idea data or error.
     """
+    # Reject if PIN is not configured or does not match (before touching other fields)
+    if not EVENT_PIN:
+        return FastJSONResponse({"ok": False, "error": "Server missing EVENT_PIN."}, status_code=500)
+    if not pin_matches(pin):
+        return FastJSONResponse({"ok": False, "error": "Invalid PIN."}, status_code=401)
+
     # Trim inputs for cleanliness
     author = author.strip()
     text = text.strip()
-    pin = pin.strip()
-
-    # Reject if PIN is not configured or does not match
-    if not EVENT_PIN:
-        return JSONResponse({"ok": False, "error": "Server missing EVENT_PIN."}, status_code=500)
-    if pin != EVENT_PIN:
-        return JSONResponse({"ok": False, "error": "Invalid PIN."}, status_code=401)
 
     # Reject empty fields to keep data quality
     if not author or not text:
-        return JSONResponse({"ok": False, "error": "Missing name or idea."}, status_code=400)
-
-    # Lock writes to prevent simultaneous file modifications
-    async with WRITE_LOCK:
-        # Compute new ID for the idea
-        next_id = get_next_id(IDEAS_CACHE)
-        # Create the Idea object with timestamp
-        new = Idea()
-        new.id = next_id
-        new.author = author
-        new.text = text
-        new.created_at = datetime.now().isoformat(timespec="seconds")
-
-        # Append to in-memory cache
-        IDEAS_CACHE.append(new)
+        return FastJSONResponse({"ok": False, "error": "Missing name or idea."}, status_code=400)
 
-        # Persist to CSV (append only)
-        append_csv_row(new)
-
-        # Persist full JSON (overwrite with new list)
-        persist_full_json(IDEAS_CACHE)
-
-    # Broadcast to WebSocket clients that a new idea arrived
-    await broadcast({"type": "idea.new", "data": new.to_dict()})
+    # Queue the submission for the next flush tick and wait for it to be committed
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    PENDING.put_nowait((author, text, fut))
+    new: Idea = await fut
 
     # Return success with the created idea
-    return JSONResponse({"ok": True, "idea": new.to_dict()})
+    return FastJSONResponse({"ok": True, "idea": new.to_dict()})
 
 
 # ----------------------------
@@ -322,31 +673,30 @@ def get_header() -> Dict[str, str]:
 
 
 @app.post("/header")
-async def set_header(text: str = Form(...), pin: str = Form(...)) -> JSONResponse:
+async def set_header(text: str = Form(...), pin: str = Form(...)) -> FastJSONResponse:
     """
     @brief  Update the header text if the correct PIN is provided.
     @param  text  New header text (form field).
     @param  pin   Event PIN (form field).
-    @return JSONResponse with ok flag or error.
+    @return FastJSONResponse with ok flag or error.
     """
-    # Trim inputs first
-    t = text.strip()
-    p = pin.strip()
-
     # Validate that ENV pin is set and matches
     if not EVENT_PIN:
-        return JSONResponse({"ok": False, "error": "Server missing EVENT_PIN."}, status_code=500)
-    if p != EVENT_PIN:
-        return JSONResponse({"ok": False, "error": "Invalid PIN."}, status_code=401)
+        return FastJSONResponse({"ok": False, "error": "Server missing EVENT_PIN."}, status_code=500)
+    if not pin_matches(pin):
+        return FastJSONResponse({"ok": False, "error": "Invalid PIN."}, status_code=401)
+
+    # Trim header text
+    t = text.strip()
 
     # Write header text to disk
     write_header_text(t or DEFAULT_HEADER)
 
     # Broadcast header change to all WebSocket clients
-    await broadcast({"type": "header.set", "data": read_header_text()})
+    broadcast({"type": "header.set", "data": read_header_text()})
 
     # Return success
-    return JSONResponse({"ok": True})
+    return FastJSONResponse({"ok": True})
 
 
 # ----------------------------
@@ -364,13 +714,13 @@ def export_csv() -> PlainTextResponse:
 
 
 @app.get("/export.json")
-def export_json() -> JSONResponse:
+def export_json() -> Response:
     """
     @brief  Return the full JSON payload of ideas for download/archival.
-    @return JSONResponse with array of idea dicts.
+    @return Response carrying the prebuilt JSON array bytes.
     """
-    # Convert cache to JSON response directly
-    return JSONResponse([i.to_dict() for i in IDEAS_CACHE])
+    # Serve the cached JSON body without re-serializing
+    return Response(IDEAS_JSON_BYTES, media_type="application/json")
 
 
 # ----------------------------
@@ -386,19 +736,18 @@ async def websocket_endpoint(ws: WebSocket) -> None:
     # Accept the WebSocket handshake
     await ws.accept()
 
-    # Add this socket to the active set
-    ACTIVE_SOCKETS.add(ws)
+    # Register the client and queue the initial hello ahead of any broadcast
+    # (assembled from the cached ideas JSON body; only the header is encoded here)
+    queue = register_client(ws)
+    queue.put_nowait(encode_frame(
+        b'{"type":"hello","data":{"header":'
+        + orjson.dumps(read_header_text())
+        + b',"ideas":'
+        + IDEAS_JSON_BYTES
+        + b"}}"
+    ))
 
     try:
-        # Send an initial hello payload with current state
-        await ws.send_text(json.dumps({
-            "type": "hello",
-            "data": {
-                "header": read_header_text(),
-                "ideas": [i.to_dict() for i in IDEAS_CACHE],
-            }
-        }))
-
         # Keep the connection open; we don't expect client messages,
         # but we await receive to detect disconnects cleanly.
         while True:
@@ -406,8 +755,8 @@ async def websocket_endpoint(ws: WebSocket) -> None:
             await ws.receive_text()
 
     except WebSocketDisconnect:
-        # On disconnect, remove from active sockets
-        ACTIVE_SOCKETS.discard(ws)
+        # On disconnect, remove from active clients
+        drop_client(ws)
     except Exception:
         # On any error, ensure removal and swallow exception to keep server healthy
-        ACTIVE_SOCKETS.discard(ws)
\ No newline at end of file
+        drop_client(ws)
@@ -1,12 +1,15 @@
 import pygame
+import numpy as np
 import random
 import math
 import time
 import json
 import os
+import sys
 from typing import List, Tuple, Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
+from functools import lru_cache
 import colorsys
 
 # Initialize Pygame
@@ -16,9 +19,67 @@ pygame.freetype.init()
 # Constants
 FPS = 60
 MAX_IDEAS = 50
+MIN_IDEA_SPACING = 180  # px between a new idea and recent ones
 CONFIG_FILE = "ideas_config.json"
 PRESETS_FILE = "ideas_presets.json"
 
+# Events the sliders and developer panel react to
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+# Events nothing in the app consumes; dropped by SDL before they reach the queue.
+# TEXTINPUT/TEXTEDITING stay allowed: KEYDOWN.unicode is filled from them.
+UNUSED_EVENTS = [
+    pygame.MOUSEWHEEL, pygame.JOYAXISMOTION, pygame.JOYBALLMOTION,
+    pygame.FINGERMOTION, pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE
+]
+
+# The only event types handle_events acts on; the rest are skipped each frame
+HANDLED_EVENTS = frozenset((
+    pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE,
+    pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED,
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP
+))
+
+# While minimized the loop only drains events, polling at this interval
+MINIMIZED_POLL_INTERVAL = 0.05  # seconds
+
+# The simulation steps at a fixed rate (motion constants are tuned per 60 Hz step);
+# after a long stall at most MAX_UPDATE_STEPS are run to catch up
+UPDATE_DT = 1.0 / FPS
+MAX_UPDATE_STEPS = 5
+
+# Without vsync, frames sleep until this close to their deadline and spin the rest
+FRAME_SPIN_MARGIN = 0.001  # seconds
+
+# Printed once at startup and shutdown, each as a single write
+STARTUP_BANNER = f"""{"=" * 60}
+✨ PROFESSIONAL FLOATING IDEAS DISPLAY v2.0 ✨
+{"=" * 60}
+🚀 Advanced features loaded:
+   • Real-time parameter adjustment
+   • Professional visual presets
+   • Advanced particle systems
+   • Physics simulation
+   • Performance monitoring
+   • Auto-save configurations
+   • Smart positioning algorithms
+
+🎮 Quick Controls:
+   TAB - Developer Panel | F1 - Help | F11 - Fullscreen
+   SPACE - Pause | Ctrl+C - Clear | Ctrl+S - Save Preset
+
+💡 Start typing your ideas below and watch them come to life!
+{"=" * 60}
+"""
+
+SHUTDOWN_BANNER = """
+🎉 Thank you for using Professional Floating Ideas Display!
+💾 Your settings have been saved automatically.
+"""
+
+# Current window size, refreshed on set_mode and VIDEORESIZE
+SCREEN_W, SCREEN_H = 0, 0
+
 # Enhanced color schemes
 class ColorScheme(Enum):
     MIDNIGHT = "midnight"
@@ -101,7 +162,14 @@ IDEA_COLOR_PALETTES = {
     ]
 }
 
-@dataclass
+def build_gradient_lut(palette):
+    """(N, 256, 3) uint8 table interpolating each [start, end] pair of a palette"""
+    return np.stack([np.linspace(c0, c1, 256) for c0, c1 in palette]).round().astype(np.uint8)
+
+# Precomputed gradients: GRADIENT_LUT[palette][idx, int(t * 255)] -> RGB
+GRADIENT_LUT = {name: build_gradient_lut(palette) for name, palette in IDEA_COLOR_PALETTES.items()}
+
+@dataclass(slots=True, frozen=True)
 class VisualSettings:
     """Comprehensive visual settings for the application"""
     # Movement
@@ -131,6 +199,7 @@ class VisualSettings:
     physics_enabled: bool = False
     
     # Performance
+    target_fps: int = FPS
     vsync_enabled: bool = True
     show_fps: bool = False
     particle_optimization: bool = True
@@ -155,6 +224,12 @@ class AdvancedSlider:
         # Animation
         self.hover_scale = 1.0
         self.target_hover_scale = 1.0
+        
+        # Cached sprites
+        self._track_sprites = {}
+        self._label_surf = None
+        self._label_val = None
+        self._label_font = None
     
     def update_handle_pos(self):
         progress = (self.val - self.min_val) / (self.max_val - self.min_val)
@@ -162,7 +237,16 @@ class AdvancedSlider:
         self.handle_rect.x = handle_x
         self.handle_rect.y = self.rect.y - 3
     
+    def move(self, dx, dy):
+        """Shift the slider by (dx, dy), keeping its value"""
+        self.rect.move_ip(dx, dy)
+        self.track_rect.move_ip(dx, dy)
+        self.update_handle_pos()
+    
     def handle_event(self, event):
+        if event.type not in MOUSE_EVENTS:
+            return
+        
         if event.type == pygame.MOUSEMOTION:
             self.hovered = self.handle_rect.collidepoint(event.pos)
             self.target_hover_scale = 1.2 if self.hovered else 1.0
@@ -194,38 +278,74 @@ class AdvancedSlider:
         self.hover_scale += (self.target_hover_scale - self.hover_scale) * 0.2
     
     def render(self, screen, font):
-        # Draw track
-        track_color = (80, 80, 100) if not self.hovered else (100, 100, 120)
-        pygame.draw.rect(screen, track_color, self.track_rect, border_radius=2)
-        
-        # Draw progress
-        progress_width = (self.val - self.min_val) / (self.max_val - self.min_val) * self.track_rect.width
-        progress_rect = pygame.Rect(self.track_rect.x, self.track_rect.y, progress_width, self.track_rect.height)
-        pygame.draw.rect(screen, (100, 150, 255), progress_rect, border_radius=2)
-        
-        # Draw handle with hover effect
+        # Track, with the progress part clipped from a full-width fill
+        track_surf, progress_surf = self.track_sprites(self.hovered)
+        screen.blit(track_surf, self.track_rect)
+        progress_width = int((self.val - self.min_val) / (self.max_val - self.min_val) * self.track_rect.width)
+        if progress_width > 0:
+            screen.blit(progress_surf, self.track_rect,
+                        pygame.Rect(0, 0, progress_width, self.track_rect.height))
+        
+        # Handle with hover effect
         handle_size = int(self.handle_rect.width * self.hover_scale)
-        handle_y_offset = int((self.handle_rect.width - handle_size) / 2)
-        handle_rect = pygame.Rect(
-            self.handle_rect.x + (self.handle_rect.width - handle_size) // 2,
-            self.handle_rect.y + handle_y_offset,
-            handle_size,
-            handle_size
-        )
-        
         handle_color = (120, 170, 255) if self.hovered or self.dragging else (100, 150, 255)
-        pygame.draw.ellipse(screen, handle_color, handle_rect)
-        pygame.draw.ellipse(screen, (200, 200, 220), handle_rect, 2)
-        
-        # Draw label and value
-        if self.decimal_places == 0:
-            value_str = f"{int(self.val)}"
-        else:
-            value_str = f"{self.val:.{self.decimal_places}f}"
-        
-        label_text = f"{self.label}: {value_str}"
-        text_surface = font.render(label_text, True, (220, 220, 240))
-        screen.blit(text_surface, (self.rect.x, self.rect.y - 25))
+        screen.blit(slider_handle(handle_size, handle_color),
+                    (self.handle_rect.x + (self.handle_rect.width - handle_size) // 2,
+                     self.handle_rect.y + (self.handle_rect.width - handle_size) // 2))
+        
+        # Label and value, re-rendered only when the value changes
+        if self._label_val != self.val or self._label_font is not font:
+            if self.decimal_places == 0:
+                value_str = f"{int(self.val)}"
+            else:
+                value_str = f"{self.val:.{self.decimal_places}f}"
+            self._label_surf = font.render(f"{self.label}: {value_str}", True, (220, 220, 240))
+            self._label_val = self.val
+            self._label_font = font
+        screen.blit(self._label_surf, (self.rect.x, self.rect.y - 25))
+    
+    def track_sprites(self, hovered):
+        """Track and progress fills for one hover state, drawn once per size"""
+        sprites = self._track_sprites.get(hovered)
+        if sprites is None:
+            local = pygame.Rect(0, 0, self.track_rect.width, self.track_rect.height)
+            track_color = (100, 100, 120) if hovered else (80, 80, 100)
+            track_surf = pygame.Surface(local.size, pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(track_surf, track_color, local, border_radius=2)
+            progress_surf = pygame.Surface(local.size, pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(progress_surf, (100, 150, 255), local, border_radius=2)
+            sprites = self._track_sprites[hovered] = (track_surf, progress_surf)
+        return sprites
+
+@lru_cache(maxsize=32)
+def slider_handle(size, color):
+    """Slider knob sprite for one size and fill color"""
+    surf = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.ellipse(surf, color, surf.get_rect())
+    pygame.draw.ellipse(surf, (200, 200, 220), surf.get_rect(), 2)
+    return surf
+
+# Last parse of each presets file, keyed by path: (mtime, data)
+_PRESETS_FILE_CACHE: Dict[str, Tuple[float, Dict]] = {}
+
+def read_presets_file(path: str) -> Dict[str, Dict]:
+    """Parse a presets JSON file, reusing the previous parse while its mtime is unchanged"""
+    mtime = os.path.getmtime(path)
+    cached = _PRESETS_FILE_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r') as f:
+        data = json.load(f)
+    _PRESETS_FILE_CACHE[path] = (mtime, data)
+    return data
+
+def preset_key(preset: Dict) -> Tuple:
+    """Hashable form of a preset dict (JSON turns tuples into lists)"""
+    return tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in preset.items()))
+
+@lru_cache(maxsize=32)
+def settings_from_key(key: Tuple) -> VisualSettings:
+    return VisualSettings(**dict(key))
 
 class PresetManager:
     """Manages saving and loading of visual presets"""
@@ -257,9 +377,7 @@ class PresetManager:
         
         if os.path.exists(PRESETS_FILE):
             try:
-                with open(PRESETS_FILE, 'r') as f:
-                    loaded = json.load(f)
-                    default_presets.update(loaded)
+                default_presets.update(read_presets_file(PRESETS_FILE))
             except:
                 pass
         
@@ -283,261 +401,550 @@ class PresetManager:
         """Load a preset by name"""
         if name in self.presets:
             self.current_preset = name
-            return VisualSettings(**self.presets[name])
+            return settings_from_key(preset_key(self.presets[name]))
         return VisualSettings()
 
-class EnhancedParticle:
-    """More sophisticated particle system"""
-    def __init__(self, x, y, color, particle_type="default"):
-        self.x = x
-        self.y = y
-        self.start_x = x
-        self.start_y = y
-        self.color = color
-        self.particle_type = particle_type
+# Particle kinds; only sparks get air resistance, only floats get gravity
+PARTICLE_KINDS = ("default", "spark", "float")
+PARTICLE_COMPACT_EVERY = 30  # frames between repacking live particles
+
+@lru_cache(maxsize=1024)
+def particle_sprite(color, radius):
+    """Pre-rasterized particle disc, blitted instead of drawing a circle per particle"""
+    sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+    return sprite
+
+@dataclass
+class ParticleSoA:
+    """Structure-of-arrays particle system updated with NumPy vector ops"""
+    capacity: int
+    color: Tuple[int, int, int]
+    count: int = 0
+    frames: int = 0
+    x: np.ndarray = field(init=False)
+    y: np.ndarray = field(init=False)
+    vx: np.ndarray = field(init=False)
+    vy: np.ndarray = field(init=False)
+    size: np.ndarray = field(init=False)
+    life: np.ndarray = field(init=False)
+    decay: np.ndarray = field(init=False)
+    gravity: np.ndarray = field(init=False)
+    is_spark: np.ndarray = field(init=False)
+    
+    def __post_init__(self):
+        n = self.capacity
+        self.color = tuple(self.color[:3])
+        self.x = np.zeros(n, dtype=np.float32)
+        self.y = np.zeros(n, dtype=np.float32)
+        self.vx = np.zeros(n, dtype=np.float32)
+        self.vy = np.zeros(n, dtype=np.float32)
+        self.size = np.zeros(n, dtype=np.float32)
+        self.life = np.zeros(n, dtype=np.float32)
+        self.decay = np.zeros(n, dtype=np.float32)
+        self.gravity = np.zeros(n, dtype=np.float32)
+        self.is_spark = np.zeros(n, dtype=bool)
+    
+    def __len__(self):
+        """Live particles only; dead ones hold their slot until the next compact()"""
+        return int(np.count_nonzero(self.life[:self.count] > 0))
+    
+    def arrays(self):
+        return (self.x, self.y, self.vx, self.vy, self.size,
+                self.life, self.decay, self.gravity, self.is_spark)
+    
+    def spawn(self, x, y, particle_type="default"):
+        """Fill the next free slot; silently drops the particle when full"""
+        i = self.count
+        if i >= self.capacity:
+            return
         
         if particle_type == "spark":
-            self.vx = random.uniform(-4, 4)
-            self.vy = random.uniform(-4, 4)
-            self.size = random.uniform(1, 3)
-            self.life = 1.0
-            self.decay = random.uniform(0.02, 0.05)
+            vx, vy = random.uniform(-4, 4), random.uniform(-4, 4)
+            size = random.uniform(1, 3)
+            decay = random.uniform(0.02, 0.05)
         elif particle_type == "float":
-            self.vx = random.uniform(-1, 1)
-            self.vy = random.uniform(-2, -0.5)
-            self.size = random.uniform(2, 6)
-            self.life = 1.0
-            self.decay = random.uniform(0.005, 0.02)
+            vx, vy = random.uniform(-1, 1), random.uniform(-2, -0.5)
+            size = random.uniform(2, 6)
+            decay = random.uniform(0.005, 0.02)
         else:  # default
-            self.vx = random.uniform(-2, 2)
-            self.vy = random.uniform(-2, 2)
-            self.size = random.uniform(2, 5)
-            self.life = 1.0
-            self.decay = random.uniform(0.005, 0.02)
-        
-        self.gravity = 0.1 if particle_type == "float" else 0
+            vx, vy = random.uniform(-2, 2), random.uniform(-2, 2)
+            size = random.uniform(2, 5)
+            decay = random.uniform(0.005, 0.02)
+        
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.size[i] = size
+        self.life[i] = 1.0
+        self.decay[i] = decay
+        self.gravity[i] = 0.1 if particle_type == "float" else 0
+        self.is_spark[i] = particle_type == "spark"
+        self.count = i + 1
     
-    def update(self, wind_strength=0):
-        self.x += self.vx + wind_strength
-        self.y += self.vy
-        self.vy += self.gravity
-        self.life -= self.decay
+    def update_all(self, wind_strength=0):
+        n = self.count
+        if n == 0:
+            return
         
-        # Add some physics
-        if self.particle_type == "spark":
-            self.vx *= 0.98  # Air resistance
-            self.vy *= 0.98
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        self.x[:n] += vx + wind_strength
+        self.y[:n] += vy
+        vy += self.gravity[:n]
+        self.life[:n] -= self.decay[:n]
+        
+        # Air resistance for sparks only
+        spark = self.is_spark[:n]
+        np.multiply(vx, 0.98, out=vx, where=spark)
+        np.multiply(vy, 0.98, out=vy, where=spark)
+        
+        self.frames += 1
+        if self.frames % PARTICLE_COMPACT_EVERY == 0:
+            self.compact()
+    
+    def compact(self):
+        """Repack live particles to the front of every array"""
+        alive = np.nonzero(self.life[:self.count] > 0)[0]
+        k = alive.size
+        if k != self.count:
+            for arr in self.arrays():
+                arr[:k] = arr[alive]
+            self.count = k
+    
+    def blit_sequence(self):
+        """(sprite, position) pairs for every live particle: spark halos first, then particles"""
+        n = self.count
+        if n == 0:
+            return []
+        
+        life = self.life[:n]
+        alive = np.nonzero(life > 0)[0]
+        if alive.size == 0:
+            return []
+        
+        xs = self.x[alive].astype(np.int32)
+        ys = self.y[alive].astype(np.int32)
+        sizes = np.maximum(1, (self.size[alive] * life[alive]).astype(np.int32))
+        sparks = self.is_spark[alive] & (sizes > 2)
+        
+        color = self.color
+        sequence = [(particle_sprite(color, size + 2), (px - size - 3, py - size - 3))
+                    for px, py, size in zip(xs[sparks].tolist(), ys[sparks].tolist(),
+                                            sizes[sparks].tolist())]
+        sequence += [(particle_sprite(color, size), (px - size - 1, py - size - 1))
+                     for px, py, size in zip(xs.tolist(), ys.tolist(), sizes.tolist())]
+        return sequence
     
     def render(self, screen):
-        if self.life > 0:
-            alpha = max(0, min(255, int(255 * self.life)))
-            size = max(1, int(self.size * self.life))
-            
-            # Add glow effect for certain types
-            if self.particle_type == "spark" and size > 2:
-                glow_color = (*self.color[:3], alpha // 3)
-                pygame.draw.circle(screen, self.color[:3], (int(self.x), int(self.y)), size + 2)
-            
-            pygame.draw.circle(screen, self.color[:3], (int(self.x), int(self.y)), size)
+        sequence = self.blit_sequence()
+        if sequence:
+            screen.blits(sequence, doreturn=False)
+
+# Idea motion constants
+IDEA_MARGIN = 50
+IDEA_BOTTOM_MARGIN = 150
+IDEA_DAMPING = 0.99
+IDEA_RESTITUTION = 0.8
+IDEA_BOUNCE_LO = 0.8
+IDEA_BOUNCE_HI = 1.2
+IDEA_SPEED_CAP = 1.2
+TWO_PI = math.pi * 2
+
+# Shared sine/cosine tables for the wave motion, indexed by phase * WAVE_TABLE_SCALE
+WAVE_TABLE_SIZE = 4096
+WAVE_TABLE_SCALE = WAVE_TABLE_SIZE / TWO_PI
+_SINTAB = np.sin(np.linspace(0, TWO_PI, WAVE_TABLE_SIZE, endpoint=False)).astype(np.float32)
+_COSTAB = np.cos(np.linspace(0, TWO_PI, WAVE_TABLE_SIZE, endpoint=False)).astype(np.float32)
+
+class IdeaPool:
+    """Scene-level structure-of-arrays holding the motion state of every idea"""
+    def __init__(self, capacity=MAX_IDEAS):
+        self.capacity = capacity
+        self.count = 0
+        self.ideas: List["AdvancedFloatingIdea"] = []
+        self.rng = np.random.default_rng()
+        
+        # Integrated state
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.sx = np.zeros(capacity, dtype=np.float32)
+        self.sy = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        
+        # Per-idea constants (birth stays float64: perf_counter seconds)
+        self.phase = np.zeros(capacity, dtype=np.float32)
+        self.float_amp = np.zeros(capacity, dtype=np.float32)
+        self.mass = np.ones(capacity, dtype=np.float32)
+        self.birth = np.zeros(capacity, dtype=np.float64)
+        
+        # Derived every frame, read by render
+        self.final_x = np.zeros(capacity, dtype=np.float32)
+        self.final_y = np.zeros(capacity, dtype=np.float32)
+        self.rotation = np.zeros(capacity, dtype=np.float32)
+        self.scale = np.zeros(capacity, dtype=np.float32)
+        self.alpha = np.zeros(capacity, dtype=np.int32)
+        
+        # Final position before the last step, and the blend of the two drawn this frame
+        self.prev_x = np.zeros(capacity, dtype=np.float32)
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.draw_x = np.zeros(capacity, dtype=np.float32)
+        self.draw_y = np.zeros(capacity, dtype=np.float32)
+    
+    def __len__(self):
+        return self.count
+    
+    def arrays(self):
+        return (self.x, self.y, self.sx, self.sy, self.vx, self.vy,
+                self.phase, self.float_amp, self.mass, self.birth,
+                self.final_x, self.final_y, self.rotation, self.scale, self.alpha,
+                self.prev_x, self.prev_y, self.draw_x, self.draw_y)
+    
+    def add(self, idea, x, y, sx, sy, phase, float_amp, mass, birth):
+        """Claim the next slot for idea; callers evict before the pool is full"""
+        i = self.count
+        self.x[i] = self.final_x[i] = self.prev_x[i] = self.draw_x[i] = x
+        self.y[i] = self.final_y[i] = self.prev_y[i] = self.draw_y[i] = y
+        self.sx[i] = sx
+        self.sy[i] = sy
+        self.vx[i] = self.vy[i] = 0
+        self.phase[i] = phase
+        self.float_amp[i] = float_amp
+        self.mass[i] = mass
+        self.birth[i] = birth
+        self.rotation[i] = 0
+        self.scale[i] = 0.1
+        self.alpha[i] = 0
+        
+        idea.pool = self
+        idea.slot = i
+        self.ideas.append(idea)
+        self.count = i + 1
+    
+    def remove(self, slot):
+        """Drop one idea, shifting later slots down to keep insertion order"""
+        n = self.count
+        for arr in self.arrays():
+            arr[slot:n - 1] = arr[slot + 1:n]
+        del self.ideas[slot]
+        for i in range(slot, n - 1):
+            self.ideas[i].slot = i
+        self.count = n - 1
+    
+    def clear(self):
+        self.ideas.clear()
+        self.count = 0
+    
+    def update_all(self, settings: VisualSettings, now, screen_width, screen_height,
+                   wind_strength=0, gravity_strength=0):
+        """Advance every idea by one frame with whole-array NumPy ops"""
+        n = self.count
+        if n == 0:
+            return
+        
+        self.prev_x[:n] = self.final_x[:n]
+        self.prev_y[:n] = self.final_y[:n]
+        
+        x, y = self.x[:n], self.y[:n]
+        sx, sy = self.sx[:n], self.sy[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        speed = settings.speed_multiplier
+        physics = settings.physics_enabled
+        entrance = settings.entrance_duration
+        float_amplitude = settings.float_amplitude
+        bounce_randomness = settings.bounce_randomness
+        
+        # Entrance animation
+        age = now - self.birth[:n]
+        entering = age < entrance
+        progress = age / entrance
+        self.alpha[:n] = np.where(entering, (255 * np.minimum(1.0, progress)).astype(np.int32), 255)
+        self.scale[:n] = np.where(entering, 0.3 + 0.7 * np.minimum(1.0, progress * 2), 1.0)
+        
+        # Physics-based movement if enabled, else constant drift
+        if physics:
+            mass = self.mass[:n]
+            vx += wind_strength / mass
+            vy += gravity_strength / mass
+            x += vx * speed
+            y += vy * speed
+            vx *= IDEA_DAMPING
+            vy *= IDEA_DAMPING
+        else:
+            x += sx * speed
+            y += sy * speed
+        
+        # Wave motion from the lookup tables; reduce the shared phase first so
+        # float32 keeps precision
+        phase = self.phase[:n]
+        float_amp = self.float_amp[:n] * float_amplitude
+        sin_idx = ((phase + math.fmod(now * 0.5, TWO_PI)) * WAVE_TABLE_SCALE).astype(np.int32)
+        cos_idx = ((phase + math.fmod(now * 0.35, TWO_PI)) * WAVE_TABLE_SCALE).astype(np.int32)
+        wave_x = np.take(_SINTAB, sin_idx & (WAVE_TABLE_SIZE - 1)) * float_amp
+        wave_y = np.take(_COSTAB, cos_idx & (WAVE_TABLE_SIZE - 1)) * float_amp * 0.5
+        
+        # Bounce off the screen edges
+        cap = IDEA_SPEED_CAP * speed
+        right = screen_width - IDEA_MARGIN
+        bottom = screen_height - IDEA_BOTTOM_MARGIN
+        for pos, drift, vel, high in ((x, sx, vx, right), (y, sy, vy, bottom)):
+            hit = (pos <= IDEA_MARGIN) | (pos >= high)
+            if not hit.any():
+                continue
+            if physics:
+                vel[hit] *= -IDEA_RESTITUTION
+            else:
+                factor = self.rng.uniform(IDEA_BOUNCE_LO, IDEA_BOUNCE_HI, int(hit.sum()))
+                drift[hit] = np.clip(drift[hit] * -(factor * bounce_randomness), -cap, cap)
+            np.clip(pos, IDEA_MARGIN, high, out=pos)
+        
+        # Final position with wave, rotation based on movement
+        np.add(x, wave_x, out=self.final_x[:n])
+        np.add(y, wave_y, out=self.final_y[:n])
+        if physics:
+            np.arctan2(vy, vx, out=self.rotation[:n])
+        else:
+            np.arctan2(sy, sx, out=self.rotation[:n])
+        self.rotation[:n] *= 0.1
+    
+    def interpolate(self, blend):
+        """Draw positions between the last two steps; blend 1.0 is the latest step"""
+        n = self.count
+        for prev, final, draw in ((self.prev_x, self.final_x, self.draw_x),
+                                  (self.prev_y, self.final_y, self.draw_y)):
+            np.subtract(final[:n], prev[:n], out=draw[:n])
+            draw[:n] *= blend
+            draw[:n] += prev[:n]
+
+def pool_field(name, cast=float):
+    """Read-only idea attribute backed by its IdeaPool slot"""
+    return property(lambda self: cast(getattr(self.pool, name)[self.slot]))
+
+# Frames the idea font size must hold still before the font is rebuilt
+FONT_SETTLE_FRAMES = 5
+
+@lru_cache(maxsize=32)
+def load_font(name, size):
+    """SysFont (or the default font) at a size, opened once"""
+    if name:
+        return pygame.font.SysFont(name, size)
+    return pygame.font.Font(None, size)
+
+# Settled ideas reuse transformed text snapped to these steps; tilt is at most
+# +/-18 degrees, so 1 degree bins give 37 angles per text
+TEXT_SCALE_STEP = 0.05
+TEXT_ROTATION_STEP = 1.0  # degrees
+TEXT_SCALE_EPSILON = 0.01
+TEXT_ROTATION_EPSILON = 0.02  # radians
+
+@lru_cache(maxsize=512)
+def render_text(font, text, color):
+    """Base text surface, rendered once per (font, text, color)"""
+    return font.render(text, True, color).convert_alpha()
+
+@lru_cache(maxsize=2048)
+def transformed_text(font, text, color, scale, angle):
+    """Rotozoomed render_text at an already-quantized scale and angle"""
+    if scale == 1.0 and angle == 0:
+        return render_text(font, text, color)
+    return pygame.transform.rotozoom(render_text(font, text, color), angle, scale).convert_alpha()
+
+GLOW_INTENSITY_STEP = 0.05
+# Offsets of the faint text copies that build up the halo
+GLOW_OFFSETS = [(dx, dy) for dx in (-3, -1, 1, 3) for dy in (-3, -1, 1, 3)]
+GLOW_PAD = 3
+
+def make_glow(text_surface, intensity):
+    """Soft halo: the text accumulated at GLOW_OFFSETS, each copy at intensity alpha"""
+    width, height = text_surface.get_size()
+    glow = pygame.Surface((width + GLOW_PAD * 2, height + GLOW_PAD * 2), pygame.SRCALPHA)
+    layer = text_surface.copy()
+    layer.set_alpha(int(255 * intensity))
+    glow.blits([(layer, (GLOW_PAD + dx, GLOW_PAD + dy)) for dx, dy in GLOW_OFFSETS], doreturn=False)
+    return glow
+
+@lru_cache(maxsize=2048)
+def cached_glow(font, text, color, scale, angle, intensity):
+    """make_glow of transformed_text, for settled ideas"""
+    return make_glow(transformed_text(font, text, color, scale, angle), intensity).convert_alpha()
+
+def flush_blits(screen, batch):
+    """Draw and empty a queue of (surface, dest) pairs with one blits() call"""
+    if batch:
+        screen.blits(batch, doreturn=False)
+        batch.clear()
 
 class AdvancedFloatingIdea:
     """Enhanced floating idea with more features"""
-    def __init__(self, text: str, x: float, y: float, font, settings: VisualSettings):
+    # Motion state lives in the scene's IdeaPool
+    x = pool_field("x")
+    y = pool_field("y")
+    final_x = pool_field("final_x")
+    final_y = pool_field("final_y")
+    draw_x = pool_field("draw_x")
+    draw_y = pool_field("draw_y")
+    rotation = pool_field("rotation")
+    scale = pool_field("scale")
+    alpha = pool_field("alpha", int)
+    
+    def __init__(self, text: str, x: float, y: float, font, settings: VisualSettings,
+                 pool: IdeaPool):
         self.text = text
         self.original_text = text
-        self.x = x
-        self.y = y
         self.start_x = x
         self.start_y = y
         
         # Enhanced movement
         base_speed = 0.8
-        self.speed_x = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
-        self.speed_y = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
-        self.original_speed_x = self.speed_x
-        self.original_speed_y = self.speed_y
-        
-        # Physics
-        self.velocity_x = 0
-        self.velocity_y = 0
+        speed_x = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
+        speed_y = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
         self.mass = len(text) * 0.1 + 1  # Mass based on text length
         
         # Visual properties
-        palette = IDEA_COLOR_PALETTES.get(settings.idea_palette, IDEA_COLOR_PALETTES["vibrant"])
-        self.colors = random.choice(palette)
+        self.palette_name = settings.idea_palette if settings.idea_palette in GRADIENT_LUT else "vibrant"
+        self.palette_idx = random.randrange(len(GRADIENT_LUT[self.palette_name]))
+        self.color = self.color_at(0.0)
         self.font = font
-        self.alpha = 0
-        self.scale = 0.1
-        self.rotation = 0
         
         # Enhanced animation
-        self.birth_time = time.time()
+        self.birth_time = time.perf_counter()
+        self.now = self.birth_time
         self.phase_offset = random.uniform(0, math.pi * 2)
         self.float_amplitude = random.uniform(0.3, 0.8) * settings.float_amplitude
+        pool.add(self, x, y, speed_x, speed_y, self.phase_offset,
+                 self.float_amplitude, self.mass, self.birth_time)
         
         # Trail effect
         self.trail_points = []
         self.max_trail_length = settings.trail_length
         
         # Enhanced particles
-        self.particles = []
-        particle_types = ["default", "spark", "float"]
+        self.particles = ParticleSoA(settings.particle_count, self.color)
         for _ in range(settings.particle_count):
-            p_type = random.choice(particle_types) if settings.particle_count > 15 else "default"
-            self.particles.append(EnhancedParticle(x, y, self.colors[0], p_type))
-        
-        # Store settings
-        self.settings = settings
+            p_type = random.choice(PARTICLE_KINDS) if settings.particle_count > 15 else "default"
+            self.particles.spawn(x, y, p_type)
         
         # Advanced properties
         self.health = 100.0
         self.age = 0
         self.highlight = False
         self.selected = False
+        
+        # Scratch rects reused by render
+        self._text_rect = pygame.Rect(0, 0, 0, 0)
+        self._glow_rect = pygame.Rect(0, 0, 0, 0)
+        self._hl_rect = pygame.Rect(0, 0, 0, 0)
+    
+    def color_at(self, t):
+        """Color at position t (0..1) along this idea's palette gradient"""
+        r, g, b = GRADIENT_LUT[self.palette_name][self.palette_idx, int(t * 255)].tolist()
+        return (r, g, b)
     
     def update_font(self, new_font):
         self.font = new_font
     
     def add_to_trail(self):
         if self.max_trail_length > 0:
-            self.trail_points.append((self.final_x, self.final_y, time.time()))
+            self.trail_points.append((self.final_x, self.final_y, self.now))
             if len(self.trail_points) > self.max_trail_length:
                 self.trail_points.pop(0)
     
-    def update(self, settings: VisualSettings, wind_strength=0, gravity_strength=0):
-        current_time = time.time()
-        self.age = current_time - self.birth_time
-        
-        # Entrance animation
-        if self.age < settings.entrance_duration:
-            progress = self.age / settings.entrance_duration
-            self.alpha = int(255 * min(1.0, progress))
-            self.scale = 0.3 + 0.7 * min(1.0, progress * 2)
-        else:
-            self.alpha = 255
-            self.scale = 1.0
-        
-        # Physics-based movement if enabled
-        if settings.physics_enabled:
-            # Apply forces
-            self.velocity_x += wind_strength / self.mass
-            self.velocity_y += gravity_strength / self.mass
-            
-            # Apply velocity
-            self.x += self.velocity_x * settings.speed_multiplier
-            self.y += self.velocity_y * settings.speed_multiplier
-            
-            # Damping
-            self.velocity_x *= 0.99
-            self.velocity_y *= 0.99
-        else:
-            # Original movement system
-            self.x += self.speed_x * settings.speed_multiplier
-            self.y += self.speed_y * settings.speed_multiplier
-        
-        # Enhanced wave motion
-        wave_time = current_time * 0.5
-        wave_x = math.sin(wave_time + self.phase_offset) * self.float_amplitude * settings.float_amplitude
-        wave_y = math.cos(wave_time * 0.7 + self.phase_offset) * self.float_amplitude * 0.5 * settings.float_amplitude
-        
-        # Collision detection and bouncing
-        margin = 50
-        screen_width = pygame.display.get_surface().get_width()
-        screen_height = pygame.display.get_surface().get_height()
-        
-        if self.x <= margin or self.x >= screen_width - margin:
-            if settings.physics_enabled:
-                self.velocity_x *= -0.8
-            else:
-                random_factor = random.uniform(0.8, 1.2) * settings.bounce_randomness
-                self.speed_x *= -random_factor
-                self.speed_x = max(-1.2 * settings.speed_multiplier, 
-                                 min(1.2 * settings.speed_multiplier, self.speed_x))
-            self.x = max(margin, min(screen_width - margin, self.x))
-            
-        if self.y <= margin or self.y >= screen_height - 150:
-            if settings.physics_enabled:
-                self.velocity_y *= -0.8
-            else:
-                random_factor = random.uniform(0.8, 1.2) * settings.bounce_randomness
-                self.speed_y *= -random_factor
-                self.speed_y = max(-1.2 * settings.speed_multiplier, 
-                                 min(1.2 * settings.speed_multiplier, self.speed_y))
-            self.y = max(margin, min(screen_height - 150, self.y))
-        
-        # Final position with wave
-        self.final_x = self.x + wave_x
-        self.final_y = self.y + wave_y
+    def update(self, settings: VisualSettings, wind_strength=0, gravity_strength=0, now=None):
+        """Per-idea effects; motion is stepped beforehand by IdeaPool.update_all"""
+        self.now = time.perf_counter() if now is None else now
+        self.age = self.now - self.birth_time
         
         # Update trail
         self.add_to_trail()
         
-        # Rotation based on movement
-        if settings.physics_enabled:
-            self.rotation = math.atan2(self.velocity_y, self.velocity_x) * 0.1
-        else:
-            self.rotation = math.atan2(self.speed_y, self.speed_x) * 0.1
-        
         # Update particles
         if not settings.particle_optimization or len(self.particles) < 100:
-            self.particles = [p for p in self.particles if p.life > 0]
-            for particle in self.particles:
-                particle.update(wind_strength * 0.1)
+            self.particles.update_all(wind_strength * 0.1)
     
     def is_expired(self):
         return False  # Ideas are permanent unless manually removed
     
-    def render(self, screen, settings: VisualSettings):
+    def render(self, screen, settings: VisualSettings, batch=None):
+        """Draw the idea; with a batch list, its blits are queued there for flush_blits"""
         if self.alpha > 10:
+            # Trails and highlights are draw calls, and fading ideas set alpha on
+            # shared cached surfaces: draw those in place, after what's queued
+            if batch is not None and (self.trail_points or self.selected or self.alpha < 255):
+                flush_blits(screen, batch)
+                batch = None
+            
             # Render trail
             if self.trail_points:
-                current_time = time.time()
+                current_time = self.now
                 for i, (x, y, timestamp) in enumerate(self.trail_points):
                     age = current_time - timestamp
                     trail_alpha = max(0, int(100 * (1 - age)))
                     if trail_alpha > 0:
-                        trail_color = (*self.colors[0][:3], trail_alpha)
+                        trail_color = (*self.color, trail_alpha)
                         size = max(1, int((i + 1) * 2))
                         pygame.draw.circle(screen, trail_color[:3], (int(x), int(y)), size)
             
             # Render particles
-            for particle in self.particles:
-                particle.render(screen)
+            if batch is None:
+                self.particles.render(screen)
+            else:
+                batch.extend(self.particles.blit_sequence())
             
-            # Create text surface
-            text_surface = self.font.render(self.text, True, self.colors[0])
+            # Text surface, shared by every idea with the same font/text/color
+            text_surface = render_text(self.font, self.text, self.color)
+            # Treat near-identity transforms as identity so they are skipped
+            scale = self.scale
+            if abs(scale - 1.0) < TEXT_SCALE_EPSILON:
+                scale = 1.0
+            angle = math.degrees(self.rotation) if abs(self.rotation) >= TEXT_ROTATION_EPSILON else 0
             
-            # Apply transformations
-            text_rect = text_surface.get_rect()
-            if self.scale != 1.0 or self.rotation != 0:
-                scaled_size = (int(text_rect.width * self.scale), int(text_rect.height * self.scale))
-                if scaled_size[0] > 0 and scaled_size[1] > 0:
-                    text_surface = pygame.transform.scale(text_surface, scaled_size)
-                if self.rotation != 0:
-                    text_surface = pygame.transform.rotate(text_surface, math.degrees(self.rotation))
+            # Apply transformations; exact while entering, cached once settled
+            glow_intensity = min(1.0, settings.glow_intensity)
+            glow_surface = None
+            if self.age < settings.entrance_duration:
+                if scale != 1.0 or angle != 0:
+                    text_surface = pygame.transform.rotozoom(text_surface, angle, scale)
+                if glow_intensity > 0:
+                    glow_surface = make_glow(text_surface, glow_intensity)
+            else:
+                scale = round(round(scale / TEXT_SCALE_STEP) * TEXT_SCALE_STEP, 2)
+                angle = round(angle / TEXT_ROTATION_STEP) * TEXT_ROTATION_STEP
+                text_surface = transformed_text(self.font, self.text, self.color, scale, angle)
+                if glow_intensity > 0:
+                    glow_intensity = round(round(glow_intensity / GLOW_INTENSITY_STEP) * GLOW_INTENSITY_STEP, 2)
+                    glow_surface = cached_glow(self.font, self.text, self.color,
+                                               scale, angle, glow_intensity)
             
+            # Reuse this idea's rects instead of allocating new ones per frame
             text_surface.set_alpha(self.alpha)
-            text_rect = text_surface.get_rect(center=(self.final_x, self.final_y))
+            text_rect = self._text_rect
+            text_rect.size = text_surface.get_size()
+            text_rect.center = (self.draw_x, self.draw_y)
             
-            # Enhanced glow effect
-            if settings.glow_intensity > 0:
-                glow_surface = text_surface.copy()
-                glow_alpha = int(self.alpha * settings.glow_intensity)
-                glow_surface.set_alpha(glow_alpha)
-                
-                glow_offsets = [(dx, dy) for dx in [-3, -1, 1, 3] for dy in [-3, -1, 1, 3]]
-                for dx, dy in glow_offsets:
-                    glow_rect = text_rect.copy()
-                    glow_rect.x += dx
-                    glow_rect.y += dy
+            # Enhanced glow effect: one blit of the pre-accumulated halo
+            if glow_surface is not None:
+                glow_surface.set_alpha(self.alpha)
+                glow_rect = self._glow_rect
+                glow_rect.size = glow_surface.get_size()
+                glow_rect.center = text_rect.center
+                if batch is None:
                     screen.blit(glow_surface, glow_rect)
+                else:
+                    batch.append((glow_surface, glow_rect))
             
             # Selection highlight
             if self.selected:
-                highlight_rect = text_rect.inflate(20, 20)
+                highlight_rect = self._hl_rect
+                highlight_rect.size = (text_rect.w + 20, text_rect.h + 20)
+                highlight_rect.center = text_rect.center
                 pygame.draw.rect(screen, (255, 255, 0), highlight_rect, 3)
             
-            screen.blit(text_surface, text_rect)
+            if batch is None:
+                screen.blit(text_surface, text_rect)
+            else:
+                batch.append((text_surface, text_rect))
 
 class ProfessionalDeveloperPanel:
     """Enhanced developer panel with professional features"""
@@ -566,6 +973,13 @@ class ProfessionalDeveloperPanel:
         # Performance monitoring
         self.fps_history = []
         self.show_performance = False
+        
+        # Cached static chrome, redrawn on tab switch / visibility toggle
+        self._chrome_surf = None
+        self._chrome_preset = None
+        self._chrome_dirty = True
+        self._hint_surf = self.font.render(
+            "Press TAB to open Developer Panel | F1 for Help", True, (100, 100, 120))
     
     def setup_tabs(self):
         tab_width = self.rect.width // len(self.tabs)
@@ -573,6 +987,17 @@ class ProfessionalDeveloperPanel:
             tab_rect = pygame.Rect(self.rect.x + i * tab_width, self.rect.y, tab_width, 30)
             self.tab_rects.append(tab_rect)
     
+    def reposition(self, x, y):
+        """Move the panel and its tabs and sliders, keeping all control values"""
+        dx, dy = x - self.rect.x, y - self.rect.y
+        self.rect.topleft = (x, y)
+        for tab_rect in self.tab_rects:
+            tab_rect.move_ip(dx, dy)
+        for controls in self.controls.values():
+            for control in controls:
+                control.move(dx, dy)
+        self._chrome_dirty = True
+    
     def setup_controls(self):
         """Setup all control elements"""
         base_x = self.rect.x + 10
@@ -604,7 +1029,7 @@ class ProfessionalDeveloperPanel:
         }
     
     def handle_event(self, event):
-        if not self.visible:
+        if not self.visible or event.type not in MOUSE_EVENTS:
             return
         
         # Tab handling
@@ -612,6 +1037,7 @@ class ProfessionalDeveloperPanel:
             for i, tab_rect in enumerate(self.tab_rects):
                 if tab_rect.collidepoint(event.pos):
                     self.active_tab = self.tabs[i]
+                    self._chrome_dirty = True
                     return
         
         # Control handling
@@ -630,33 +1056,38 @@ class ProfessionalDeveloperPanel:
     
     def get_settings(self) -> VisualSettings:
         """Extract settings from all controls"""
-        settings = VisualSettings()
+        values = {}
         
         # Movement tab
         if "Movement" in self.controls:
             controls = self.controls["Movement"]
-            settings.speed_multiplier = controls[0].val
-            settings.float_amplitude = controls[1].val
-            settings.bounce_randomness = controls[2].val
-            settings.gravity_strength = controls[3].val
-            settings.wind_strength = controls[4].val
+            values['speed_multiplier'] = controls[0].val
+            values['float_amplitude'] = controls[1].val
+            values['bounce_randomness'] = controls[2].val
+            values['gravity_strength'] = controls[3].val
+            values['wind_strength'] = controls[4].val
         
         # Visual tab
         if "Visual" in self.controls:
             controls = self.controls["Visual"]
-            settings.idea_font_size = int(controls[0].val)
-            settings.entrance_duration = controls[1].val
-            settings.glow_intensity = controls[2].val
-            settings.trail_length = int(controls[3].val)
+            values['idea_font_size'] = int(controls[0].val)
+            values['entrance_duration'] = controls[1].val
+            values['glow_intensity'] = controls[2].val
+            values['trail_length'] = int(controls[3].val)
         
         # Effects tab
         if "Effects" in self.controls:
             controls = self.controls["Effects"]
-            settings.particle_count = int(controls[0].val)
-            settings.bg_particle_count = int(controls[1].val)
-            settings.bg_particle_speed = controls[2].val
+            values['particle_count'] = int(controls[0].val)
+            values['bg_particle_count'] = int(controls[1].val)
+            values['bg_particle_speed'] = controls[2].val
+        
+        # Performance tab
+        if "Performance" in self.controls:
+            controls = self.controls["Performance"]
+            values['target_fps'] = int(controls[0].val)
         
-        return settings
+        return VisualSettings(**values)
     
     def apply_preset(self, preset_name: str):
         """Apply a preset to all controls"""
@@ -689,30 +1120,55 @@ class ProfessionalDeveloperPanel:
             controls[2].val = settings.bg_particle_speed
             for control in controls:
                 control.update_handle_pos()
+        
+        if "Performance" in self.controls:
+            controls = self.controls["Performance"]
+            controls[0].val = settings.target_fps
+            for control in controls:
+                control.update_handle_pos()
     
-    def render(self, screen):
-        if not self.visible:
-            hint_text = "Press TAB to open Developer Panel | F1 for Help"
-            hint_surface = self.font.render(hint_text, True, (100, 100, 120))
-            screen.blit(hint_surface, (10, 10))
-            return
+    def render_chrome(self):
+        """Draw panel background, tabs and status bar onto a cached surface"""
+        chrome = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
+        local_rect = chrome.get_rect()
+        offset_x, offset_y = self.rect.topleft
         
         # Panel background with rounded corners
-        pygame.draw.rect(screen, (25, 25, 35), self.rect, border_radius=10)
-        pygame.draw.rect(screen, (60, 60, 80), self.rect, 2, border_radius=10)
+        pygame.draw.rect(chrome, (25, 25, 35), local_rect, border_radius=10)
+        pygame.draw.rect(chrome, (60, 60, 80), local_rect, 2, border_radius=10)
         
         # Tabs
-        for i, (tab, tab_rect) in enumerate(zip(self.tabs, self.tab_rects)):
+        for tab, tab_rect in zip(self.tabs, self.tab_rects):
+            tab_rect = tab_rect.move(-offset_x, -offset_y)
             tab_color = (40, 40, 50) if tab == self.active_tab else (30, 30, 40)
             border_color = (80, 120, 200) if tab == self.active_tab else (50, 50, 60)
             
-            pygame.draw.rect(screen, tab_color, tab_rect, border_radius=5)
-            pygame.draw.rect(screen, border_color, tab_rect, 2, border_radius=5)
+            pygame.draw.rect(chrome, tab_color, tab_rect, border_radius=5)
+            pygame.draw.rect(chrome, border_color, tab_rect, 2, border_radius=5)
             
             text_color = (220, 220, 240) if tab == self.active_tab else (180, 180, 200)
             tab_surface = self.tab_font.render(tab, True, text_color)
             tab_text_rect = tab_surface.get_rect(center=tab_rect.center)
-            screen.blit(tab_surface, tab_text_rect)
+            chrome.blit(tab_surface, tab_text_rect)
+        
+        # Status bar
+        status_text = f"Preset: {self.preset_manager.current_preset}"
+        status_surface = self.font.render(status_text, True, (180, 180, 200))
+        chrome.blit(status_surface, (10, local_rect.bottom - 25))
+        
+        self._chrome_surf = chrome
+        self._chrome_preset = self.preset_manager.current_preset
+        self._chrome_dirty = False
+    
+    def render(self, screen):
+        if not self.visible:
+            screen.blit(self._hint_surf, (10, 10))
+            return
+        
+        # Background, tabs and status bar only change with the tab or preset
+        if self._chrome_dirty or self._chrome_preset != self.preset_manager.current_preset:
+            self.render_chrome()
+        screen.blit(self._chrome_surf, self.rect)
         
         # Content area
         content_rect = pygame.Rect(self.rect.x, self.rect.y + 35, self.rect.width, self.rect.height - 35)
@@ -724,12 +1180,6 @@ class ProfessionalDeveloperPanel:
         
         elif self.active_tab == "Presets":
             self.render_presets_tab(screen, content_rect)
-        
-        # Status bar
-        status_y = self.rect.bottom - 25
-        status_text = f"Preset: {self.preset_manager.current_preset}"
-        status_surface = self.font.render(status_text, True, (180, 180, 200))
-        screen.blit(status_surface, (self.rect.x + 10, status_y))
     
     def render_presets_tab(self, screen, content_rect):
         """Render the presets management tab"""
@@ -770,6 +1220,9 @@ class ProfessionalDeveloperPanel:
     
     def toggle_visibility(self):
         self.visible = not self.visible
+        self._chrome_dirty = True
+
+INPUT_TEXT_CACHE_MAX = 64  # entries per input box text cache
 
 class EnhancedInputBox:
     """Professional input box with advanced features"""
@@ -793,12 +1246,19 @@ class EnhancedInputBox:
         self.border_glow = 0
         self.target_glow = 0
         
+        # Rendered text and widths, keyed by content so edits never go stale
+        self._text_surf_cache = {}
+        self._text_width_cache = {}
+        self._visible_for = None
+        self._visible = ""
+        
         # Common idea suggestions
         self.suggestions = [
             "Innovation", "Creativity", "Problem solving", "Team collaboration",
             "User experience", "Sustainability", "Digital transformation",
             "Artificial intelligence", "Data analytics", "Remote work"
         ]
+        self._suggest_trie = self.build_suggestion_trie()
     
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -810,7 +1270,7 @@ class EnhancedInputBox:
                 self.target_glow = 0
         
         if event.type == pygame.KEYDOWN and self.active:
-            if event.key == pygame.K_RETURN and not (pygame.key.get_pressed()[pygame.K_LCTRL]):
+            if event.key == pygame.K_RETURN and not (event.mod & pygame.KMOD_CTRL):
                 result = self.text.strip()
                 if result:
                     self.text_history.append(result)
@@ -867,13 +1327,32 @@ class EnhancedInputBox:
         
         return None
     
+    def build_suggestion_trie(self):
+        """Prefix trie over lowercased suggestions; '$' lists the suggestions below a node"""
+        root = {'$': []}
+        for suggestion in self.suggestions:
+            node = root
+            for ch in suggestion.lower():
+                node = node.setdefault(ch, {'$': []})
+                node['$'].append(suggestion)
+        return root
+    
     def update_suggestions(self):
         """Update auto-complete suggestions based on current text"""
         if len(self.text) >= 2:
-            self.auto_complete_suggestions = [
-                s for s in self.suggestions 
-                if s.lower().startswith(self.text.lower()) and s.lower() != self.text.lower()
-            ][:5]  # Limit to 5 suggestions
+            node = self._suggest_trie
+            for ch in self.text.lower():
+                node = node.get(ch)
+                if node is None:
+                    break
+            if node is None:
+                self.auto_complete_suggestions = []
+            else:
+                # Everything below the node shares the prefix; skip exact matches
+                query_len = len(self.text)
+                self.auto_complete_suggestions = [
+                    s for s in node['$'] if len(s) != query_len
+                ][:5]  # Limit to 5 suggestions
             self.show_suggestions = len(self.auto_complete_suggestions) > 0
         else:
             self.show_suggestions = False
@@ -888,10 +1367,48 @@ class EnhancedInputBox:
         # Smooth glow animation
         self.border_glow += (self.target_glow - self.border_glow) * 0.1
     
+    def _render_cached(self, text, color):
+        """font.render, memoized per (text, color) with FIFO eviction"""
+        key = (text, color)
+        surface = self._text_surf_cache.get(key)
+        if surface is None:
+            if len(self._text_surf_cache) >= INPUT_TEXT_CACHE_MAX:
+                del self._text_surf_cache[next(iter(self._text_surf_cache))]
+            surface = self._text_surf_cache[key] = self.font.render(text, True, color).convert_alpha()
+        return surface
+    
+    def _width_cached(self, text):
+        """font.size(text)[0], memoized with FIFO eviction"""
+        width = self._text_width_cache.get(text)
+        if width is None:
+            if len(self._text_width_cache) >= INPUT_TEXT_CACHE_MAX:
+                del self._text_width_cache[next(iter(self._text_width_cache))]
+            width = self._text_width_cache[text] = self.font.size(text)[0]
+        return width
+    
+    def _visible_text(self, display_text):
+        """Tail of display_text that fits in the box; remembers the last answer"""
+        if self._visible_for != display_text:
+            visible_text = display_text
+            available = self.rect.width - 30
+            if self._width_cached(display_text) > available:
+                # Scroll text if too long: binary-search the first kept character
+                lo, hi = 1, len(display_text)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if self.font.size(display_text[mid:])[0] <= available:
+                        hi = mid
+                    else:
+                        lo = mid + 1
+                visible_text = display_text[lo:]
+            self._visible_for = display_text
+            self._visible = visible_text
+        return self._visible
+    
     def render(self, screen):
         # Enhanced border with glow
-        border_color = (71 + int(self.border_glow), 85 + int(self.border_glow), 105 + int(self.border_glow))
-        glow_rect = self.rect.inflate(int(self.border_glow/2), int(self.border_glow/2))
+        glow = int(self.border_glow)
+        border_color = (71 + glow, 85 + glow, 105 + glow)
         
         # Background
         bg_color = (51, 65, 85) if self.active else (30, 41, 59)
@@ -903,16 +1420,8 @@ class EnhancedInputBox:
         text_color = (248, 250, 252) if self.text else (148, 163, 184)
         
         if display_text:
-            # Handle text overflow
-            text_surface = self.font.render(display_text, True, text_color)
-            text_width = text_surface.get_width()
-            
-            if text_width > self.rect.width - 30:
-                # Scroll text if too long
-                visible_text = display_text
-                while self.font.size(visible_text)[0] > self.rect.width - 30 and len(visible_text) > 0:
-                    visible_text = visible_text[1:]
-                text_surface = self.font.render(visible_text, True, text_color)
+            # Handle text overflow; only recomputed when the text changes
+            text_surface = self._render_cached(self._visible_text(display_text), text_color)
             
             text_x = self.rect.x + 15
             text_y = self.rect.y + (self.rect.height - text_surface.get_height()) // 2
@@ -921,14 +1430,11 @@ class EnhancedInputBox:
         # Enhanced cursor
         if self.active and self.cursor_visible:
             cursor_text = self.text[:self.cursor_pos]
-            cursor_width = self.font.size(cursor_text)[0] if cursor_text else 0
+            cursor_width = self._width_cached(cursor_text) if cursor_text else 0
             cursor_x = self.rect.x + 15 + cursor_width
             cursor_y = self.rect.y + 8
             
-            # Animated cursor
-            cursor_alpha = int(128 + 127 * math.sin(time.time() * 5))
-            cursor_color = (248, 250, 252, cursor_alpha)
-            pygame.draw.line(screen, cursor_color[:3], 
+            pygame.draw.line(screen, (248, 250, 252),
                            (cursor_x, cursor_y), (cursor_x, cursor_y + self.rect.height - 16), 3)
         
         # Auto-complete suggestions
@@ -940,26 +1446,104 @@ class EnhancedInputBox:
                 pygame.draw.rect(screen, (40, 50, 70), suggestion_rect, border_radius=5)
                 pygame.draw.rect(screen, (80, 90, 110), suggestion_rect, 1, border_radius=5)
                 
-                suggestion_surface = self.font.render(suggestion, True, (200, 200, 220))
+                suggestion_surface = self._render_cached(suggestion, (200, 200, 220))
                 screen.blit(suggestion_surface, (suggestion_rect.x + 8, suggestion_rect.y + 4))
 
+# Background particle colors and the pixel footprint of each integer radius
+BG_PARTICLE_COLORS = np.array([(100, 116, 139), (59, 130, 246), (34, 197, 94)], dtype=np.uint8)
+
+def disc_offsets(radius):
+    """(dx, dy) arrays covering a small filled disc of the given radius"""
+    span = range(-(radius - 1), radius)
+    offsets = [(dx, dy) for dx in span for dy in span if dx * dx + dy * dy <= radius * radius - radius]
+    return np.array([o[0] for o in offsets]), np.array([o[1] for o in offsets])
+
+BG_DISC_OFFSETS = {radius: disc_offsets(radius) for radius in (1, 2, 3)}
+
+class BackgroundParticles:
+    """Background drift particles as NumPy arrays, stamped straight into screen pixels"""
+    def __init__(self, count, speed, width, height):
+        self.x = np.random.randint(0, width + 1, count).astype(np.float32)
+        self.y = np.random.randint(0, height + 1, count).astype(np.float32)
+        self.vx = (np.random.uniform(-0.5, 0.5, count) * speed).astype(np.float32)
+        self.vy = (np.random.uniform(-0.5, 0.5, count) * speed).astype(np.float32)
+        self.size = np.random.uniform(1, 4, count).astype(np.int32)
+        self.color = BG_PARTICLE_COLORS[np.random.randint(0, len(BG_PARTICLE_COLORS), count)]
+        self._step = np.empty(count, dtype=np.float32)  # scratch for the scaled velocity
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def rescale(self, old_size, new_size):
+        """Stretch positions from one screen size to another"""
+        self.x *= new_size[0] / old_size[0]
+        self.y *= new_size[1] / old_size[1]
+    
+    def update(self, speed, width, height):
+        x, y, step = self.x, self.y, self._step
+        x += np.multiply(self.vx, speed, out=step)
+        y += np.multiply(self.vy, speed, out=step)
+        
+        # Wrap around screen
+        x[x < -10] = width + 10
+        x[x > width + 10] = -10
+        y[y < -10] = height + 10
+        y[y > height + 10] = -10
+    
+    def render(self, surface):
+        width, height = surface.get_size()
+        ix = self.x.astype(np.int32)
+        iy = self.y.astype(np.int32)
+        
+        pixels = pygame.surfarray.pixels3d(surface)
+        for radius, (dx, dy) in BG_DISC_OFFSETS.items():
+            sel = self.size == radius
+            if not sel.any():
+                continue
+            # Every particle of this radius x every pixel of its disc
+            px = (ix[sel][:, None] + dx).ravel()
+            py = (iy[sel][:, None] + dy).ravel()
+            colors = np.repeat(self.color[sel], len(dx), axis=0)
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            pixels[px[inside], py[inside]] = colors[inside]
+        del pixels  # unlock the surface before blitting
+
+# Button background per visual state
+BUTTON_STATE_COLORS = {
+    'idle': (75, 85, 99),
+    'hovered': (59, 130, 246),
+    'pressed': (37, 99, 235)
+}
+
+def button_state(button):
+    """Key into button['surfaces'] for the button's current state"""
+    if button['pressed']:
+        return 'pressed'
+    if button['hovered']:
+        return 'hovered'
+    return 'idle'
+
 class ProfessionalIdeasDisplay:
     """Main application class with professional features"""
     def __init__(self):
         pygame.display.init()
-        
-        # Display setup
-        self.setup_display()
+        pygame.event.set_blocked(UNUSED_EVENTS)
         
         # Initialize settings first
         self.settings = VisualSettings()
         self.preset_manager = PresetManager()
         
         # Load saved configuration
+        self._last_saved_json = None
         self.load_config()
         
+        # Display setup (needs settings.vsync_enabled)
+        self.setup_display()
+        
         # Load professional fonts (now that settings exist)
         self.setup_fonts()
+        self._pending_font_size = self.last_font_size
+        self._font_settle_frames = 0
         
         # Initialize systems
         self.dev_panel = ProfessionalDeveloperPanel(self.screen_width - 450, 50, 440, 700)
@@ -968,21 +1552,33 @@ class ProfessionalIdeasDisplay:
         self.setup_ui()
         
         # Application state
-        self.ideas: List[AdvancedFloatingIdea] = []
+        self.idea_pool = IdeaPool(MAX_IDEAS)
+        self.ideas: List[AdvancedFloatingIdea] = self.idea_pool.ideas
         self.running = True
         self.fullscreen = False
         self.paused = False
+        self.minimized = False
         self.show_help = False
         
         # Performance monitoring
         self.fps_counter = 0
-        self.fps_timer = time.time()
+        self.fps_timer = time.perf_counter()
         self.current_fps = 60
+        self.total_particles = 0  # refreshed with the FPS sample
         
         # Background system
-        self.bg_particles = []
         self.regenerate_bg_particles()
         
+        # Cached overlay text: (key, rendered)
+        self._status_cache = (None, None)
+        self._perf_cache = (None, None)
+        self._scheme_cache = (None, None)
+        self._help_cache = (None, None)
+        self._welcome_cache = None
+        
+        # Reused queue of idea blits, drawn with one blits() per frame
+        self._idea_blits = []
+        
         # Statistics
         self.stats = {
             'total_ideas': 0,
@@ -995,13 +1591,15 @@ class ProfessionalIdeasDisplay:
         self.screen_width = 1600
         self.screen_height = 1000
         
-        # Try to get optimal display mode
-        info = pygame.display.Info()
+        # Try to get optimal display mode; queried before set_mode, so this is the desktop size
+        self.desktop_info = pygame.display.Info()
+        info = self.desktop_info
         if info.current_w >= 1600 and info.current_h >= 1000:
             self.screen_width = min(1600, info.current_w - 100)
             self.screen_height = min(1000, info.current_h - 100)
         
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        self.screen = self.set_display_mode((self.screen_width, self.screen_height))
+        self.sync_screen_size()
         pygame.display.set_caption("✨ Professional Floating Ideas Display v2.0")
         
         # Set application icon (if available)
@@ -1015,6 +1613,23 @@ class ProfessionalIdeasDisplay:
         
         self.clock = pygame.time.Clock()
     
+    def sync_screen_size(self):
+        """Refresh the cached window size after the display surface changes"""
+        global SCREEN_W, SCREEN_H
+        SCREEN_W, SCREEN_H = self.screen.get_size()
+        self.screen_width, self.screen_height = SCREEN_W, SCREEN_H
+    
+    def set_display_mode(self, size, flags=0):
+        """set_mode, asking SDL for vsync when enabled and the window supports it"""
+        # SDL2 only honours vsync for renderer-backed windows, so it is requested only
+        # when the caller opts into SCALED or OPENGL; plain windows keep their sizing
+        if self.settings.vsync_enabled and flags & (pygame.SCALED | pygame.OPENGL):
+            try:
+                return pygame.display.set_mode(size, flags, vsync=1)
+            except pygame.error:
+                pass
+        return pygame.display.set_mode(size, flags)
+    
     def setup_fonts(self):
         """Load and configure professional fonts"""
         self.fonts = {}
@@ -1086,10 +1701,16 @@ class ProfessionalIdeasDisplay:
                 lambda p=preset: self.apply_quick_preset(p)
             )
             self.preset_buttons.append(btn)
+        
+        # Hit-tested together: one collidelist() per mouse event
+        self.buttons = [self.submit_button, self.clear_button] + self.preset_buttons
+        self.button_rects = [button['rect'] for button in self.buttons]
+        self.hovered_button = None
+        self.pressed_button = None
     
     def create_button(self, x, y, width, height, text, callback):
         """Create a styled button"""
-        return {
+        button = {
             'rect': pygame.Rect(x, y, width, height),
             'text': text,
             'callback': callback,
@@ -1097,14 +1718,31 @@ class ProfessionalIdeasDisplay:
             'pressed': False,
             'font': self.fonts['normal_bold']
         }
+        button['surfaces'] = {
+            state: self.draw_button_surface(button, bg_color)
+            for state, bg_color in BUTTON_STATE_COLORS.items()
+        }
+        return button
+    
+    def draw_button_surface(self, button, bg_color):
+        """Pre-render one visual state of a button"""
+        surface = pygame.Surface(button['rect'].size, pygame.SRCALPHA).convert_alpha()
+        local_rect = surface.get_rect()
+        
+        # Draw button with rounded corners
+        pygame.draw.rect(surface, bg_color, local_rect, border_radius=8)
+        pygame.draw.rect(surface, (156, 163, 175), local_rect, 2, border_radius=8)
+        
+        # Button text
+        text_surface = button['font'].render(button['text'], True, (255, 255, 255))
+        surface.blit(text_surface, text_surface.get_rect(center=local_rect.center))
+        return surface
     
     def update_idea_font(self, size):
         """Update font for ideas"""
+        self.last_font_size = int(size)
         try:
-            if self.base_font_name:
-                self.idea_font = pygame.font.SysFont(self.base_font_name, int(size))
-            else:
-                self.idea_font = pygame.font.Font(None, int(size))
+            self.idea_font = load_font(self.base_font_name, int(size))
             
             # Update existing ideas
             for idea in self.ideas:
@@ -1119,30 +1757,27 @@ class ProfessionalIdeasDisplay:
                 with open(CONFIG_FILE, 'r') as f:
                     config = json.load(f)
                     self.settings = VisualSettings(**config)
+                self._last_saved_json = json.dumps(asdict(self.settings), indent=2)
             except:
                 pass
     
     def save_config(self):
-        """Save current configuration"""
+        """Save current configuration, skipping the write if nothing changed"""
         try:
+            config_json = json.dumps(asdict(self.settings), indent=2)
+            if config_json == self._last_saved_json:
+                return
             with open(CONFIG_FILE, 'w') as f:
-                json.dump(asdict(self.settings), f, indent=2)
+                f.write(config_json)
+            self._last_saved_json = config_json
         except:
             pass
     
     def regenerate_bg_particles(self):
         """Generate background particles"""
-        self.bg_particles = []
-        for _ in range(int(self.settings.bg_particle_count)):
-            self.bg_particles.append({
-                'x': random.randint(0, self.screen_width),
-                'y': random.randint(0, self.screen_height),
-                'vx': random.uniform(-0.5, 0.5) * self.settings.bg_particle_speed,
-                'vy': random.uniform(-0.5, 0.5) * self.settings.bg_particle_speed,
-                'size': random.uniform(1, 4),
-                'alpha': random.randint(30, 80),
-                'color': random.choice([(100, 116, 139), (59, 130, 246), (34, 197, 94)])
-            })
+        self.bg_particles = BackgroundParticles(int(self.settings.bg_particle_count),
+                                                self.settings.bg_particle_speed,
+                                                self.screen_width, self.screen_height)
     
     def add_current_idea(self):
         """Add idea from input box"""
@@ -1157,14 +1792,14 @@ class ProfessionalIdeasDisplay:
         """Add a new floating idea"""
         # Clean up old ideas if at limit
         while len(self.ideas) >= MAX_IDEAS:
-            self.ideas.pop(0)
+            self.idea_pool.remove(0)
         
         # Smart positioning to avoid overlaps
         position = self.find_good_position()
         
         # Create enhanced idea
-        new_idea = AdvancedFloatingIdea(text, position[0], position[1], self.idea_font, self.settings)
-        self.ideas.append(new_idea)
+        AdvancedFloatingIdea(text, position[0], position[1], self.idea_font,
+                             self.settings, self.idea_pool)
         
         # Update statistics
         self.stats['total_ideas'] += 1
@@ -1175,21 +1810,28 @@ class ProfessionalIdeasDisplay:
     
     def find_good_position(self) -> Tuple[float, float]:
         """Find a good position for new idea that doesn't overlap"""
+        # Bucket the recent ideas' current positions into a coarse grid once
+        pool = self.idea_pool
+        recent = slice(max(0, pool.count - 10), pool.count)  # Check recent ideas
+        grid: Dict[Tuple[int, int], List[Tuple[float, float]]] = {}
+        for px, py in zip(pool.final_x[recent].tolist(), pool.final_y[recent].tolist()):
+            cell = (int(px) // MIN_IDEA_SPACING, int(py) // MIN_IDEA_SPACING)
+            grid.setdefault(cell, []).append((px, py))
+        
+        min_dist_sq = MIN_IDEA_SPACING * MIN_IDEA_SPACING
         attempts = 0
         while attempts < 30:
             x = random.randint(100, self.screen_width - 500)
             y = random.randint(100, self.screen_height - 150)
             
-            # Check for overlaps
-            overlap = False
-            for existing_idea in self.ideas[-10:]:  # Check recent ideas
-                dx = x - getattr(existing_idea, 'final_x', existing_idea.x)
-                dy = y - getattr(existing_idea, 'final_y', existing_idea.y)
-                distance = math.sqrt(dx*dx + dy*dy)
-                
-                if distance < 180:  # Minimum distance
-                    overlap = True
-                    break
+            # Check for overlaps against the surrounding 3x3 cells only
+            gx, gy = x // MIN_IDEA_SPACING, y // MIN_IDEA_SPACING
+            overlap = any(
+                (x - px) ** 2 + (y - py) ** 2 < min_dist_sq
+                for cx in (gx - 1, gx, gx + 1)
+                for cy in (gy - 1, gy, gy + 1)
+                for px, py in grid.get((cx, cy), ())
+            )
             
             if not overlap:
                 return (x, y)
@@ -1201,7 +1843,7 @@ class ProfessionalIdeasDisplay:
     
     def clear_all_ideas(self):
         """Clear all floating ideas"""
-        self.ideas.clear()
+        self.idea_pool.clear()
         print("🗑️ Cleared all ideas")
     
     def apply_quick_preset(self, preset_name: str):
@@ -1221,66 +1863,70 @@ class ProfessionalIdeasDisplay:
         if self.dev_panel.visible:
             self.settings = self.dev_panel.get_settings()
         
-        # Update font if changed
-        current_font_size = int(self.settings.idea_font_size)
-        if current_font_size != getattr(self, 'last_font_size', 36):
-            self.update_idea_font(current_font_size)
-            self.last_font_size = current_font_size
+        settings = self.settings  # read once; hot paths below use the local
+        
+        # Update font once the size has stopped changing (e.g. slider released)
+        current_font_size = int(settings.idea_font_size)
+        if current_font_size != self._pending_font_size:
+            self._pending_font_size = current_font_size
+            self._font_settle_frames = 0
+        elif current_font_size != self.last_font_size:
+            self._font_settle_frames += 1
+            if self._font_settle_frames >= FONT_SETTLE_FRAMES:
+                self.update_idea_font(current_font_size)
+                self.last_font_size = current_font_size
         
         # Update background particles
-        if len(self.bg_particles) != int(self.settings.bg_particle_count):
+        if len(self.bg_particles) != int(settings.bg_particle_count):
             self.regenerate_bg_particles()
         
-        for particle in self.bg_particles:
-            particle['x'] += particle['vx'] * self.settings.bg_particle_speed
-            particle['y'] += particle['vy'] * self.settings.bg_particle_speed
-            
-            # Wrap around screen
-            if particle['x'] < -10:
-                particle['x'] = self.screen_width + 10
-            elif particle['x'] > self.screen_width + 10:
-                particle['x'] = -10
-                
-            if particle['y'] < -10:
-                particle['y'] = self.screen_height + 10
-            elif particle['y'] > self.screen_height + 10:
-                particle['y'] = -10
+        self.bg_particles.update(settings.bg_particle_speed,
+                                 self.screen_width, self.screen_height)
         
         # Update UI components
         self.input_box.update()
         self.dev_panel.update()
         
         # Update ideas with physics
-        for idea in self.ideas[:]:
-            idea.update(self.settings, self.settings.wind_strength, self.settings.gravity_strength)
-        
-        # Performance monitoring
+        wind, gravity = settings.wind_strength, settings.gravity_strength
+        now = time.perf_counter()  # one timestamp for the whole step
+        self.idea_pool.update_all(settings, now, SCREEN_W, SCREEN_H, wind, gravity)
+        for idea in self.ideas:
+            idea.update(settings, wind, gravity, now)
+    
+    def render(self, blend=1.0):
+        """Main rendering loop; blend places ideas between the last two update steps"""
+        # Performance monitoring (counts drawn frames, not update steps)
         self.fps_counter += 1
-        if time.time() - self.fps_timer >= 1.0:
+        now = time.perf_counter()
+        if now - self.fps_timer >= 1.0:
             self.current_fps = self.fps_counter
+            self.total_particles = sum(len(idea.particles) for idea in self.ideas)
             self.fps_counter = 0
-            self.fps_timer = time.time()
-    
-    def render(self):
-        """Main rendering loop"""
+            self.fps_timer = now
+        
         # Dynamic background
-        current_scheme = COLOR_SCHEMES.get(ColorScheme(self.settings.color_scheme), COLOR_SCHEMES[ColorScheme.MIDNIGHT])
+        settings = self.settings
+        if settings.color_scheme != self._scheme_cache[0]:
+            self._scheme_cache = (settings.color_scheme,
+                                  COLOR_SCHEMES.get(ColorScheme(settings.color_scheme), COLOR_SCHEMES[ColorScheme.MIDNIGHT]))
+        current_scheme = self._scheme_cache[1]
         self.screen.fill(current_scheme['background'])
         
         # Enhanced background particles
-        for particle in self.bg_particles:
-            size = int(particle['size'])
-            alpha_color = (*particle['color'], particle['alpha'])
-            pygame.draw.circle(self.screen, particle['color'], 
-                             (int(particle['x']), int(particle['y'])), size)
+        self.bg_particles.render(self.screen)
         
         # Welcome message for empty state
         if not self.ideas:
             self.render_welcome_screen()
         
         # Render floating ideas
+        self.idea_pool.interpolate(blend)
+        screen = self.screen
+        batch = self._idea_blits
         for idea in self.ideas:
-            idea.render(self.screen, self.settings)
+            idea.render(screen, settings, batch)
+        flush_blits(screen, batch)
         
         # Render UI
         self.render_ui()
@@ -1289,7 +1935,7 @@ class ProfessionalIdeasDisplay:
         self.dev_panel.render(self.screen)
         
         # Performance overlay
-        if self.settings.show_fps:
+        if settings.show_fps:
             self.render_performance_overlay()
         
         # Help overlay
@@ -1300,20 +1946,23 @@ class ProfessionalIdeasDisplay:
     
     def render_welcome_screen(self):
         """Render welcome screen when no ideas are present"""
+        if self._welcome_cache is None:
+            self._welcome_cache = self.build_welcome_surface()
+        
+        # Offset is relative to the title's center
+        (offset_x, offset_y), surface = self._welcome_cache
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2 - 100
-        
+        self.screen.blit(surface, (center_x + offset_x, center_y + offset_y))
+    
+    def build_welcome_surface(self):
+        """Draw the static welcome text once, cropped to its bounding box: (offset, surface)"""
         # Main title with gradient effect
-        title_text = "Professional Ideas Visualizer"
-        title_surface = self.fonts['title_bold'].render(title_text, True, (248, 250, 252))
-        title_rect = title_surface.get_rect(center=(center_x, center_y))
-        self.screen.blit(title_surface, title_rect)
+        lines = [(self.fonts['title_bold'].render("Professional Ideas Visualizer", True, (248, 250, 252)), 0)]
         
         # Subtitle
         subtitle_text = "Transform your thoughts into beautiful floating visualizations"
-        subtitle_surface = self.fonts['medium'].render(subtitle_text, True, (148, 163, 184))
-        subtitle_rect = subtitle_surface.get_rect(center=(center_x, center_y + 50))
-        self.screen.blit(subtitle_surface, subtitle_rect)
+        lines.append((self.fonts['medium'].render(subtitle_text, True, (148, 163, 184)), 50))
         
         # Feature highlights
         features = [
@@ -1324,55 +1973,44 @@ class ProfessionalIdeasDisplay:
         ]
         
         for i, feature in enumerate(features):
-            feature_surface = self.fonts['normal'].render(feature, True, (180, 190, 200))
-            feature_rect = feature_surface.get_rect(center=(center_x, center_y + 100 + i * 30))
-            self.screen.blit(feature_surface, feature_rect)
+            lines.append((self.fonts['normal'].render(feature, True, (180, 190, 200)), 100 + i * 30))
+        
+        # Each line is centered on (0, offset); lay them out relative to the bounding box
+        rects = [surface.get_rect(center=(0, offset)) for surface, offset in lines]
+        bounds = rects[0].unionall(rects[1:])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA).convert_alpha()
+        for (line, _), rect in zip(lines, rects):
+            surface.blit(line, rect.move(-bounds.x, -bounds.y))
+        return bounds.topleft, surface
     
     def render_ui(self):
         """Render user interface elements"""
         # Input area
         self.input_box.render(self.screen)
         
-        # Buttons
-        self.render_button(self.submit_button)
-        self.render_button(self.clear_button)
-        
-        # Preset buttons
-        for button in self.preset_buttons:
-            self.render_button(button)
+        # Action and preset buttons in one blits() call
+        self.screen.blits(
+            [(button['surfaces'][button_state(button)], button['rect'])
+             for button in self.buttons],
+            doreturn=False
+        )
         
-        # Status bar
+        # Status bar, re-rendered only when one of its values changes
         status_y = self.screen_height - 25
-        status_items = [
-            f"Ideas: {len(self.ideas)}/{MAX_IDEAS}",
-            f"Total: {self.stats['total_ideas']}",
-            f"Rate: {self.stats['ideas_per_minute']:.1f}/min",
-            f"Preset: {self.preset_manager.current_preset}",
-            "TAB: Dev Panel | F1: Help | F11: Fullscreen"
-        ]
-        
-        status_text = " | ".join(status_items)
-        status_surface = self.fonts['small'].render(status_text, True, (120, 130, 150))
-        self.screen.blit(status_surface, (50, status_y))
-    
-    def render_button(self, button):
-        """Render a styled button"""
-        # Button colors based on state
-        if button['pressed']:
-            bg_color = (37, 99, 235)
-        elif button['hovered']:
-            bg_color = (59, 130, 246)
-        else:
-            bg_color = (75, 85, 99)
-        
-        # Draw button with rounded corners
-        pygame.draw.rect(self.screen, bg_color, button['rect'], border_radius=8)
-        pygame.draw.rect(self.screen, (156, 163, 175), button['rect'], 2, border_radius=8)
-        
-        # Button text
-        text_surface = button['font'].render(button['text'], True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=button['rect'].center)
-        self.screen.blit(text_surface, text_rect)
+        status_key = (len(self.ideas), self.stats['total_ideas'],
+                      round(self.stats['ideas_per_minute'], 1), self.preset_manager.current_preset)
+        if status_key != self._status_cache[0]:
+            status_items = [
+                f"Ideas: {len(self.ideas)}/{MAX_IDEAS}",
+                f"Total: {self.stats['total_ideas']}",
+                f"Rate: {self.stats['ideas_per_minute']:.1f}/min",
+                f"Preset: {self.preset_manager.current_preset}",
+                "TAB: Dev Panel | F1: Help | F11: Fullscreen"
+            ]
+            
+            status_text = " | ".join(status_items)
+            self._status_cache = (status_key, self.fonts['small'].render(status_text, True, (120, 130, 150)))
+        self.screen.blit(self._status_cache[1], (50, status_y))
     
     def render_performance_overlay(self):
         """Render performance monitoring overlay"""
@@ -1380,27 +2018,38 @@ class ProfessionalIdeasDisplay:
         pygame.draw.rect(self.screen, (0, 0, 0, 128), overlay_rect)
         pygame.draw.rect(self.screen, (100, 100, 120), overlay_rect, 2)
         
-        perf_data = [
-            f"FPS: {self.current_fps}",
-            f"Ideas: {len(self.ideas)}",
-            f"Particles: {sum(len(idea.particles) for idea in self.ideas)}",
-            f"BG Particles: {len(self.bg_particles)}"
-        ]
+        perf_key = (self.current_fps, len(self.ideas), self.total_particles, len(self.bg_particles))
+        if perf_key != self._perf_cache[0]:
+            perf_data = [
+                f"FPS: {perf_key[0]}",
+                f"Ideas: {perf_key[1]}",
+                f"Particles: {perf_key[2]}",
+                f"BG Particles: {perf_key[3]}"
+            ]
+            self._perf_cache = (perf_key, [self.fonts['small'].render(data, True, (220, 220, 240))
+                                           for data in perf_data])
         
-        for i, data in enumerate(perf_data):
-            text_surface = self.fonts['small'].render(data, True, (220, 220, 240))
+        for i, text_surface in enumerate(self._perf_cache[1]):
             self.screen.blit(text_surface, (overlay_rect.x + 10, overlay_rect.y + 10 + i * 20))
     
     def render_help_overlay(self):
         """Render help overlay"""
-        overlay_rect = pygame.Rect(100, 100, self.screen_width - 200, self.screen_height - 200)
-        pygame.draw.rect(self.screen, (20, 20, 30, 240), overlay_rect)
-        pygame.draw.rect(self.screen, (100, 120, 150), overlay_rect, 3, border_radius=10)
+        size = (self.screen_width - 200, self.screen_height - 200)
+        if size != self._help_cache[0]:
+            self._help_cache = (size, self.build_help_surface(size))
+        self.screen.blit(self._help_cache[1], (100, 100))
+    
+    def build_help_surface(self, size):
+        """Draw the static help overlay once for a given size"""
+        surface = pygame.Surface(size).convert()
+        overlay_rect = surface.get_rect()
+        surface.fill((20, 20, 30))
+        pygame.draw.rect(surface, (100, 120, 150), overlay_rect, 3, border_radius=10)
         
         # Title
         title_surface = self.fonts['large_bold'].render("Help & Controls", True, (255, 255, 255))
         title_rect = title_surface.get_rect(center=(overlay_rect.centerx, overlay_rect.y + 40))
-        self.screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
         
         # Help sections
         help_sections = {
@@ -1444,12 +2093,12 @@ class ProfessionalIdeasDisplay:
             
             # Section title
             section_surface = self.fonts['medium_bold'].render(section, True, (100, 150, 255))
-            self.screen.blit(section_surface, (x_pos, y_offset))
+            surface.blit(section_surface, (x_pos, y_offset))
             
             # Section items
             for i, item in enumerate(items):
                 item_surface = self.fonts['normal'].render(item, True, (220, 220, 240))
-                self.screen.blit(item_surface, (x_pos + 10, y_offset + 30 + i * 25))
+                surface.blit(item_surface, (x_pos + 10, y_offset + 30 + i * 25))
             
             y_offset += 30 + len(items) * 25 + 20
             
@@ -1462,17 +2111,30 @@ class ProfessionalIdeasDisplay:
         close_text = "Press F1 or ESC to close this help"
         close_surface = self.fonts['medium'].render(close_text, True, (180, 180, 200))
         close_rect = close_surface.get_rect(center=(overlay_rect.centerx, overlay_rect.bottom - 30))
-        self.screen.blit(close_surface, close_rect)
+        surface.blit(close_surface, close_rect)
+        return surface
     
     def handle_events(self):
         """Handle all input events"""
+        # One unfiltered get() keeps clicks and keys in the order they happened
         for event in pygame.event.get():
+            if event.type not in HANDLED_EVENTS:
+                continue
             if event.type == pygame.QUIT:
                 self.save_config()
                 self.running = False
+            elif event.type == pygame.VIDEORESIZE:
+                self.screen = pygame.display.get_surface()
+                self.sync_screen_size()
+            elif event.type == pygame.WINDOWMINIMIZED:
+                self.minimized = True
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED):
+                self.minimized = False
             
             # Global keyboard shortcuts
             if event.type == pygame.KEYDOWN:
+                # Modifier state travels with the event; no key-state snapshot needed
+                ctrl = event.mod & pygame.KMOD_CTRL
                 if event.key == pygame.K_F11:
                     self.toggle_fullscreen()
                 elif event.key == pygame.K_ESCAPE:
@@ -1487,11 +2149,11 @@ class ProfessionalIdeasDisplay:
                 elif event.key == pygame.K_SPACE:
                     self.paused = not self.paused
                     print(f"Animation {'paused' if self.paused else 'resumed'}")
-                elif event.key == pygame.K_c and pygame.key.get_pressed()[pygame.K_LCTRL]:
+                elif event.key == pygame.K_c and ctrl:
                     self.clear_all_ideas()
-                elif event.key == pygame.K_r and pygame.key.get_pressed()[pygame.K_LCTRL]:
+                elif event.key == pygame.K_r and ctrl:
                     self.reset_to_defaults()
-                elif event.key == pygame.K_s and pygame.key.get_pressed()[pygame.K_LCTRL]:
+                elif event.key == pygame.K_s and ctrl:
                     self.save_current_as_preset()
             
             # Skip other event handling if help is shown
@@ -1515,20 +2177,36 @@ class ProfessionalIdeasDisplay:
     
     def handle_button_events(self, event):
         """Handle button interactions"""
-        all_buttons = [self.submit_button, self.clear_button] + self.preset_buttons
+        event_type = event.type
+        if event_type not in MOUSE_EVENTS:
+            return
         
-        for button in all_buttons:
-            if event.type == pygame.MOUSEMOTION:
-                button['hovered'] = button['rect'].collidepoint(event.pos)
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if button['rect'].collidepoint(event.pos):
-                    button['pressed'] = True
-            
-            elif event.type == pygame.MOUSEBUTTONUP:
-                if button['pressed'] and button['rect'].collidepoint(event.pos):
-                    button['callback']()
-                button['pressed'] = False
+        # Buttons don't overlap, so at most one is under the pointer
+        index = pygame.Rect(event.pos, (1, 1)).collidelist(self.button_rects)
+        hit = self.buttons[index] if index >= 0 else None
+        
+        if event_type == pygame.MOUSEMOTION:
+            if hit is not self.hovered_button:
+                if self.hovered_button is not None:
+                    self.hovered_button['hovered'] = False
+                if hit is not None:
+                    hit['hovered'] = True
+                self.hovered_button = hit
+        
+        elif event_type == pygame.MOUSEBUTTONDOWN:
+            if hit is not None:
+                if self.pressed_button is not None:
+                    self.pressed_button['pressed'] = False
+                hit['pressed'] = True
+                self.pressed_button = hit
+        
+        else:  # MOUSEBUTTONUP
+            pressed = self.pressed_button
+            if pressed is not None:
+                if pressed is hit:
+                    pressed['callback']()
+                pressed['pressed'] = False
+                self.pressed_button = None
     
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
@@ -1540,74 +2218,92 @@ class ProfessionalIdeasDisplay:
     
     def save_current_as_preset(self):
         """Save current settings as a new preset"""
-        preset_name = f"Custom_{int(time.time())}"
+        # Two saves within the same second get a numeric suffix instead of overwriting
+        base_name = f"Custom_{int(time.time())}"
+        preset_name = base_name
+        suffix = 2
+        while preset_name in self.preset_manager.presets:
+            preset_name = f"{base_name}_{suffix}"
+            suffix += 1
         self.preset_manager.save_preset(preset_name, self.settings)
         print(f"💾 Saved current settings as '{preset_name}'")
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
         self.fullscreen = not self.fullscreen
+        old_size = (self.screen_width, self.screen_height)
         
         if self.fullscreen:
-            info = pygame.display.Info()
-            self.screen_width = info.current_w
-            self.screen_height = info.current_h
-            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.FULLSCREEN)
+            self.screen_width = self.desktop_info.current_w
+            self.screen_height = self.desktop_info.current_h
+            self.screen = self.set_display_mode((self.screen_width, self.screen_height), pygame.FULLSCREEN)
+            self.sync_screen_size()
             print("🖥️ Switched to fullscreen mode")
         else:
             self.screen_width = 1600
             self.screen_height = 1000
-            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+            self.screen = self.set_display_mode((self.screen_width, self.screen_height))
+            self.sync_screen_size()
             print("🪟 Switched to windowed mode")
         
         # Update UI layout for new screen size
         self.setup_ui()
-        self.dev_panel = ProfessionalDeveloperPanel(self.screen_width - 450, 50, 440, 700)
-        self.regenerate_bg_particles()
+        self.dev_panel.reposition(self.screen_width - 450, 50)
+        self.bg_particles.rescale(old_size, (self.screen_width, self.screen_height))
+    
+    def wait_for_next_frame(self, target_fps):
+        """Sleep most of the time left in the frame, then spin for an exact deadline"""
+        now = time.perf_counter()
+        # If the frame ran long, pace from now rather than trying to catch up
+        deadline = max(self.frame_deadline + 1.0 / target_fps, now)
+        remaining = deadline - now - FRAME_SPIN_MARGIN
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < deadline:
+            pass
+        self.frame_deadline = deadline
     
     def run(self):
         """Main application loop"""
-        print("=" * 60)
-        print("✨ PROFESSIONAL FLOATING IDEAS DISPLAY v2.0 ✨")
-        print("=" * 60)
-        print("🚀 Advanced features loaded:")
-        print("   • Real-time parameter adjustment")
-        print("   • Professional visual presets") 
-        print("   • Advanced particle systems")
-        print("   • Physics simulation")
-        print("   • Performance monitoring")
-        print("   • Auto-save configurations")
-        print("   • Smart positioning algorithms")
-        print()
-        print("🎮 Quick Controls:")
-        print("   TAB - Developer Panel | F1 - Help | F11 - Fullscreen")
-        print("   SPACE - Pause | Ctrl+C - Clear | Ctrl+S - Save Preset")
-        print()
-        print("💡 Start typing your ideas below and watch them come to life!")
-        print("=" * 60)
-        
-        target_fps = 60
+        sys.stdout.write(STARTUP_BANNER)
+        sys.stdout.flush()
+        
+        self.frame_deadline = time.perf_counter()
+        previous = self.frame_deadline
+        lag = 0.0
         
         while self.running:
-            # Dynamic FPS adjustment
-            if hasattr(self.settings, 'target_fps'):
-                target_fps = self.settings.target_fps
-            
             self.handle_events()
-            self.update()
-            self.render()
+            
+            # Nothing is visible: keep draining events so the OS sees us responsive
+            if self.minimized:
+                time.sleep(MINIMIZED_POLL_INTERVAL)
+                previous = time.perf_counter()
+                continue
+            
+            # Fixed-rate simulation, independent of how fast frames are drawn
+            now = time.perf_counter()
+            lag = min(lag + now - previous, MAX_UPDATE_STEPS * UPDATE_DT)
+            previous = now
+            while lag >= UPDATE_DT:
+                self.update()
+                lag -= UPDATE_DT
+            # Paused steps leave prev and final positions apart; hold ideas on the latter
+            self.render(1.0 if self.paused else lag / UPDATE_DT)
             
             # Adaptive frame rate
+            target_fps = self.settings.target_fps
             if self.settings.vsync_enabled:
+                # Still capped: SDL can accept vsync=1 without flip() ever blocking
                 self.clock.tick(target_fps)
             else:
-                self.clock.tick_busy_loop(target_fps)
+                self.wait_for_next_frame(target_fps)
         
         # Cleanup
         self.save_config()
         pygame.quit()
-        print("\n🎉 Thank you for using Professional Floating Ideas Display!")
-        print("💾 Your settings have been saved automatically.")
+        sys.stdout.write(SHUTDOWN_BANNER)
+        sys.stdout.flush()
 
 # Entry point
 if __name__ == "__main__":
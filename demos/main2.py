@@ -2,6 +2,8 @@ import pygame
 import random
 import math
 import time
+import numpy as np
+from functools import lru_cache
 from typing import List, Tuple
 import pygame.freetype
 
@@ -42,6 +44,30 @@ IDEA_COLORS = [
     [(165, 180, 252), (99, 102, 241)],  # Indigo gradient
 ]
 
+# Background particles: one color, radius 1 or 2 (size is uniform(1, 3) truncated)
+BG_PARTICLE_COLOR = (100, 116, 139)
+BG_PARTICLE_RADII = (1, 2)
+
+# Offsets of the faint copies drawn behind idea text as a glow
+GLOW_OFFSETS = ((-2, -2), (-2, 2), (2, -2), (2, 2))
+
+# Event types nothing reads; SDL drops them before they reach the queue
+UNUSED_EVENTS = [
+    pygame.MOUSEWHEEL, pygame.JOYAXISMOTION, pygame.JOYBALLMOTION,
+    pygame.FINGERMOTION, pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE
+]
+
+def make_circle_sprite(radius, color):
+    """Circle drawn once onto a transparent surface, blitted at (x - radius - 1, y - radius - 1)"""
+    sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (radius + 1, radius + 1), radius)
+    return sprite.convert_alpha()
+
+@lru_cache(maxsize=64)
+def particle_sprite(color, radius):
+    """Shared circle sprite per particle color and radius"""
+    return make_circle_sprite(radius, color)
+
 class Slider:
     def __init__(self, x, y, width, height, min_val, max_val, initial_val, label):
         self.rect = pygame.Rect(x, y, width, height)
@@ -52,6 +78,10 @@ class Slider:
         self.dragging = False
         self.handle_rect = pygame.Rect(0, 0, 20, height)
         self.update_handle_pos()
+        
+        # Rendered "label: value" text and the (label, value) it shows
+        self._label_cache = None
+        self._cached_val_key = None
     
     def update_handle_pos(self):
         progress = (self.val - self.min_val) / (self.max_val - self.min_val)
@@ -60,6 +90,7 @@ class Slider:
         self.handle_rect.y = self.rect.y
     
     def handle_event(self, event):
+        """Returns True when the event moved the slider's value"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.handle_rect.collidepoint(event.pos):
                 self.dragging = True
@@ -68,8 +99,11 @@ class Slider:
         elif event.type == pygame.MOUSEMOTION and self.dragging:
             rel_x = event.pos[0] - self.rect.x - self.handle_rect.width // 2
             progress = max(0, min(1, rel_x / (self.rect.width - self.handle_rect.width)))
+            old_val = self.val
             self.val = self.min_val + progress * (self.max_val - self.min_val)
             self.update_handle_pos()
+            return self.val != old_val
+        return False
     
     def render(self, screen, font):
         # Draw slider background
@@ -79,10 +113,12 @@ class Slider:
         # Draw handle
         pygame.draw.rect(screen, DEV_SLIDER_HANDLE, self.handle_rect)
         
-        # Draw label and value
-        label_text = f"{self.label}: {self.val:.2f}"
-        text_surface = font.render(label_text, True, DEV_TEXT_COLOR)
-        screen.blit(text_surface, (self.rect.x, self.rect.y - 25))
+        # Draw label and value, re-rendered only when the shown value changes
+        key = (self.label, round(self.val, 2))
+        if key != self._cached_val_key:
+            self._label_cache = font.render(f"{self.label}: {self.val:.2f}", True, DEV_TEXT_COLOR)
+            self._cached_val_key = key
+        screen.blit(self._label_cache, (self.rect.x, self.rect.y - 25))
 
 class ColorPicker:
     def __init__(self, x, y, width, height, initial_color, label):
@@ -93,17 +129,22 @@ class ColorPicker:
         self.g_slider = Slider(x, y + 60, width - 50, 20, 0, 255, initial_color[1], "G")
         self.b_slider = Slider(x, y + 90, width - 50, 20, 0, 255, initial_color[2], "B")
         self.color_preview = pygame.Rect(x + width - 40, y + 30, 30, 60)
+        self._label_surface = None
     
     def handle_event(self, event):
-        self.r_slider.handle_event(event)
-        self.g_slider.handle_event(event)
-        self.b_slider.handle_event(event)
-        self.color = (int(self.r_slider.val), int(self.g_slider.val), int(self.b_slider.val))
+        """Returns True when the event changed the picked color"""
+        changed = self.r_slider.handle_event(event)
+        changed |= self.g_slider.handle_event(event)
+        changed |= self.b_slider.handle_event(event)
+        if changed:
+            self.color = (int(self.r_slider.val), int(self.g_slider.val), int(self.b_slider.val))
+        return changed
     
     def render(self, screen, font):
-        # Draw label
-        text_surface = font.render(self.label, True, DEV_TEXT_COLOR)
-        screen.blit(text_surface, (self.rect.x, self.rect.y))
+        # Draw label, rendered on first use
+        if self._label_surface is None:
+            self._label_surface = font.render(self.label, True, DEV_TEXT_COLOR)
+        screen.blit(self._label_surface, (self.rect.x, self.rect.y))
         
         # Draw sliders
         self.r_slider.render(screen, font)
@@ -159,6 +200,10 @@ class DeveloperPanel:
             self.speed_slider, self.amplitude_slider, self.bounce_slider,
             self.font_size_slider, self.entrance_slider, self.particle_slider
         ]
+        
+        # Settings built from the controls, rebuilt only after one of them changes
+        self._settings = None
+        self._dirty = True
     
     def toggle_visibility(self):
         self.visible = not self.visible
@@ -168,11 +213,15 @@ class DeveloperPanel:
             return
         
         for slider in self.sliders:
-            slider.handle_event(event)
+            if slider.handle_event(event):
+                self._dirty = True
         
-        self.bg_color_picker.handle_event(event)
+        if self.bg_color_picker.handle_event(event):
+            self._dirty = True
     
     def get_settings(self):
+        if not self._dirty:
+            return self._settings
         settings = DevSettings()
         settings.speed_multiplier = self.speed_slider.val
         settings.float_amplitude = self.amplitude_slider.val
@@ -181,6 +230,8 @@ class DeveloperPanel:
         settings.entrance_duration = self.entrance_slider.val
         settings.particle_count = int(self.particle_slider.val)
         settings.background_color = self.bg_color_picker.color
+        self._settings = settings
+        self._dirty = False
         return settings
     
     def render(self, screen):
@@ -217,48 +268,178 @@ class DeveloperPanel:
             inst_surface = self.font.render(instruction, True, (150, 150, 170))
             screen.blit(inst_surface, (self.rect.x + 250, self.rect.y + 200 + i * 20))
 
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-2, 2)
-        self.vy = random.uniform(-2, 2)
+class ParticleBurst:
+    """A burst of particles sharing one color, stored as parallel NumPy arrays"""
+    def __init__(self, x, y, color, count):
         self.color = color
-        self.size = random.uniform(2, 5)
-        self.life = 1.0
-        self.decay = random.uniform(0.005, 0.02)
+        self.x = np.full(count, x, dtype=np.float32)
+        self.y = np.full(count, y, dtype=np.float32)
+        self.vx = np.random.uniform(-2, 2, count).astype(np.float32)
+        self.vy = np.random.uniform(-2, 2, count).astype(np.float32)
+        self.size = np.random.uniform(2, 5, count).astype(np.float32)
+        self.life = np.ones(count, dtype=np.float32)
+        self.decay = np.random.uniform(0.005, 0.02, count).astype(np.float32)
+    
+    def __len__(self):
+        return len(self.life)
     
     def update(self):
+        # Drop dead particles, then step the rest together
+        alive = self.life > 0
+        if not alive.all():
+            for name in ('x', 'y', 'vx', 'vy', 'size', 'life', 'decay'):
+                setattr(self, name, getattr(self, name)[alive])
         self.x += self.vx
         self.y += self.vy
         self.life -= self.decay
-        
+    
     def render(self, screen):
-        if self.life > 0:
-            alpha = int(255 * self.life)
-            color = (*self.color, alpha)
-            size = int(self.size * self.life)
-            if size > 0:
-                pygame.draw.circle(screen, self.color[:3], (int(self.x), int(self.y)), size)
+        sizes = (self.size * self.life).astype(np.int32)
+        visible = (self.life > 0) & (sizes > 0)
+        if not visible.any():
+            return
+        
+        # Cached circle sprites, all blitted in one call
+        sizes = sizes[visible]
+        xs = (self.x[visible].astype(np.int32) - sizes - 1).tolist()
+        ys = (self.y[visible].astype(np.int32) - sizes - 1).tolist()
+        color = self.color[:3]
+        screen.blits([(particle_sprite(color, size), (x, y))
+                      for size, x, y in zip(sizes.tolist(), xs, ys)], doreturn=False)
+
+class IdeaPool:
+    """Structure-of-arrays holding the motion state of every floating idea"""
+    def __init__(self, capacity=MAX_IDEAS):
+        self.capacity = capacity
+        self.count = 0
+        self.ideas: List["FloatingIdea"] = []
+        self.rng = np.random.default_rng()
+        
+        # Integrated state
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.speed_x = np.zeros(capacity, dtype=np.float32)
+        self.speed_y = np.zeros(capacity, dtype=np.float32)
+        
+        # Per-idea constants (birth stays float64: time.time() seconds)
+        self.phase = np.zeros(capacity, dtype=np.float32)
+        self.float_amp = np.zeros(capacity, dtype=np.float32)
+        self.entrance = np.ones(capacity, dtype=np.float32)
+        self.birth = np.zeros(capacity, dtype=np.float64)
+        
+        # Derived every frame, read by render
+        self.final_x = np.zeros(capacity, dtype=np.float32)
+        self.final_y = np.zeros(capacity, dtype=np.float32)
+        self.rotation = np.zeros(capacity, dtype=np.float32)
+        self.scale = np.zeros(capacity, dtype=np.float32)
+        self.alpha = np.zeros(capacity, dtype=np.int32)
+    
+    def __len__(self):
+        return self.count
+    
+    def arrays(self):
+        return (self.x, self.y, self.speed_x, self.speed_y,
+                self.phase, self.float_amp, self.entrance, self.birth,
+                self.final_x, self.final_y, self.rotation, self.scale, self.alpha)
+    
+    def add(self, idea, x, y, speed_x, speed_y, phase, float_amp, entrance, birth):
+        """Claim the next slot for idea; callers evict before the pool is full"""
+        i = self.count
+        self.x[i] = self.final_x[i] = x
+        self.y[i] = self.final_y[i] = y
+        self.speed_x[i] = speed_x
+        self.speed_y[i] = speed_y
+        self.phase[i] = phase
+        self.float_amp[i] = float_amp
+        self.entrance[i] = entrance
+        self.birth[i] = birth
+        self.rotation[i] = 0
+        self.scale[i] = 0.1
+        self.alpha[i] = 0
+        
+        idea.pool = self
+        idea.slot = i
+        self.ideas.append(idea)
+        self.count = i + 1
+    
+    def remove(self, slot):
+        """Drop one idea, shifting later slots down to keep insertion order"""
+        n = self.count
+        for arr in self.arrays():
+            arr[slot:n - 1] = arr[slot + 1:n]
+        del self.ideas[slot]
+        for i in range(slot, n - 1):
+            self.ideas[i].slot = i
+        self.count = n - 1
+    
+    def update(self, ctx):
+        """Advance every idea one frame; ctx is (now, speed_multiplier, float_amplitude, bounce_randomness)"""
+        n = self.count
+        if n == 0:
+            return
+        now, speed, amplitude, bounce = ctx
+        x, y = self.x[:n], self.y[:n]
+        speed_x, speed_y = self.speed_x[:n], self.speed_y[:n]
+        
+        # Smooth entrance animation, then full opacity
+        age = now - self.birth[:n]
+        entrance = self.entrance[:n]
+        entering = age < entrance
+        self.alpha[:n] = np.where(entering, 255 * np.minimum(1.0, age / entrance), 255)
+        self.scale[:n] = np.where(entering, 0.3 + 0.7 * np.minimum(1.0, age * 2 / entrance), 1.0)
+        
+        # Main floating movement
+        x += speed_x * speed
+        y += speed_y * speed
+        
+        # Gentle wave motion; reduce the shared time first so float32 keeps precision
+        phase = self.phase[:n]
+        float_amp = self.float_amp[:n] * amplitude
+        wave_x = np.sin(phase + math.fmod(now * 0.5, 2 * math.pi)) * float_amp
+        wave_y = np.cos(phase + math.fmod(now * 0.35, 2 * math.pi)) * float_amp * 0.5
+        
+        # Bounce off edges with adjustable randomness
+        margin = 50
+        cap = 1.2 * speed
+        for pos, vel, high in ((x, speed_x, SCREEN_WIDTH - margin), (y, speed_y, SCREEN_HEIGHT - 150)):
+            hit = (pos <= margin) | (pos >= high)
+            if hit.any():
+                factor = self.rng.uniform(0.8, 1.2, int(hit.sum())) * bounce
+                vel[hit] = np.clip(vel[hit] * -factor, -cap, cap)
+                np.clip(pos, margin, high, out=pos)
+        
+        # Final position with wave, rotation based on movement
+        np.add(x, wave_x, out=self.final_x[:n])
+        np.add(y, wave_y, out=self.final_y[:n])
+        np.arctan2(speed_y, speed_x, out=self.rotation[:n])
+        self.rotation[:n] *= 0.1
+
+def pool_field(name, cast=float):
+    """Read-only idea attribute backed by its IdeaPool slot"""
+    return property(lambda self: cast(getattr(self.pool, name)[self.slot]))
 
 class FloatingIdea:
-    def __init__(self, text: str, x: float, y: float, font, settings: DevSettings):
+    # Motion state lives in the display's IdeaPool
+    x = pool_field("x")
+    y = pool_field("y")
+    final_x = pool_field("final_x")
+    final_y = pool_field("final_y")
+    rotation = pool_field("rotation")
+    scale = pool_field("scale")
+    alpha = pool_field("alpha", int)
+    
+    def __init__(self, text: str, x: float, y: float, font, settings: DevSettings, pool: IdeaPool):
         self.text = text
-        self.x = x
-        self.y = y
         self.original_font = font
         
         # Movement properties (now adjustable)
         base_speed = 0.8
-        self.speed_x = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
-        self.speed_y = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
+        speed_x = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
+        speed_y = random.uniform(-base_speed, base_speed) * settings.speed_multiplier
         
         # Visual properties
         self.colors = random.choice(IDEA_COLORS)
         self.font = font
-        self.alpha = 0
-        self.scale = 0.1
-        self.rotation = 0
         self.target_alpha = 255
         self.target_scale = 1.0
         
@@ -266,67 +447,48 @@ class FloatingIdea:
         self.birth_time = time.time()
         self.phase_offset = random.uniform(0, math.pi * 2)
         self.float_amplitude = random.uniform(0.3, 0.8) * settings.float_amplitude
-        self.particles = []
         
         # Create entrance particles (count now adjustable)
-        for _ in range(settings.particle_count):
-            self.particles.append(Particle(x, y, self.colors[0]))
+        self.particles = ParticleBurst(x, y, self.colors[0], settings.particle_count)
         
         # Store settings reference
         self.entrance_duration = settings.entrance_duration
         self.bounce_randomness = settings.bounce_randomness
+        pool.add(self, x, y, speed_x, speed_y, self.phase_offset,
+                 self.float_amplitude, self.entrance_duration, self.birth_time)
+        
+        # Rendered text, and its scaled/rotated form plus glow copy for (scale, rotation)
+        self._base_surface = None
+        self._transform_key = None
+        self._text_surface = None
+        self._glow_surface = None
     
     def update_font(self, new_font):
         """Update the font for dynamic font size changes"""
         self.font = new_font
+        self._base_surface = None
+        self._transform_key = None
     
-    def update(self, settings: DevSettings):
-        current_time = time.time()
-        age = current_time - self.birth_time
-        
-        # Smooth entrance animation (duration now adjustable)
-        if age < self.entrance_duration:
-            self.alpha = int(255 * min(1.0, age / self.entrance_duration))
-            self.scale = 0.3 + 0.7 * min(1.0, age * 2 / self.entrance_duration)
-        else:
-            # After entrance, keep at full opacity
-            self.alpha = 255
-            self.scale = 1.0
-        
-        # Main floating movement (speed now adjustable)
-        self.x += self.speed_x * settings.speed_multiplier
-        self.y += self.speed_y * settings.speed_multiplier
-        
-        # Add gentle wave motion (amplitude now adjustable)
-        wave_time = current_time * 0.5
-        wave_x = math.sin(wave_time + self.phase_offset) * self.float_amplitude * settings.float_amplitude
-        wave_y = math.cos(wave_time * 0.7 + self.phase_offset) * self.float_amplitude * 0.5 * settings.float_amplitude
-        
-        # Bounce off edges with adjustable randomness
-        margin = 50
-        if self.x <= margin or self.x >= SCREEN_WIDTH - margin:
-            random_factor = random.uniform(0.8, 1.2) * settings.bounce_randomness
-            self.speed_x *= -random_factor
-            self.speed_x = max(-1.2 * settings.speed_multiplier, min(1.2 * settings.speed_multiplier, self.speed_x))
-            self.x = max(margin, min(SCREEN_WIDTH - margin, self.x))
-            
-        if self.y <= margin or self.y >= SCREEN_HEIGHT - 150:
-            random_factor = random.uniform(0.8, 1.2) * settings.bounce_randomness
-            self.speed_y *= -random_factor
-            self.speed_y = max(-1.2 * settings.speed_multiplier, min(1.2 * settings.speed_multiplier, self.speed_y))
-            self.y = max(margin, min(SCREEN_HEIGHT - 150, self.y))
+    def text_surfaces(self):
+        """Text and glow surfaces for the current scale and rotation, rebuilt only when they change"""
+        if self._base_surface is None:
+            self._base_surface = self.font.render(self.text, True, self.colors[0])
         
-        # Apply wave motion to final position
-        self.final_x = self.x + wave_x
-        self.final_y = self.y + wave_y
-        
-        # Gentle rotation based on movement
-        self.rotation = math.atan2(self.speed_y, self.speed_x) * 0.1
-        
-        # Update particles
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update()
+        key = (self.scale, self.rotation)
+        if key != self._transform_key:
+            # Scale and rotate the text
+            text_surface = self._base_surface
+            if self.scale != 1.0 or self.rotation != 0:
+                text_rect = text_surface.get_rect()
+                scaled_size = (int(text_rect.width * self.scale), int(text_rect.height * self.scale))
+                if scaled_size[0] > 0 and scaled_size[1] > 0:
+                    text_surface = pygame.transform.scale(text_surface, scaled_size)
+                if self.rotation != 0:
+                    text_surface = pygame.transform.rotate(text_surface, math.degrees(self.rotation))
+            self._text_surface = text_surface
+            self._glow_surface = text_surface.copy()
+            self._transform_key = key
+        return self._text_surface, self._glow_surface
     
     def is_expired(self):
         return False
@@ -334,20 +496,10 @@ class FloatingIdea:
     def render(self, screen):
         if self.alpha > 10:
             # Render particles
-            for particle in self.particles:
-                particle.render(screen)
+            self.particles.render(screen)
             
-            # Create gradient text surface
-            text_surface = self.font.render(self.text, True, self.colors[0])
-            
-            # Scale and rotate the text
-            text_rect = text_surface.get_rect()
-            if self.scale != 1.0 or self.rotation != 0:
-                scaled_size = (int(text_rect.width * self.scale), int(text_rect.height * self.scale))
-                if scaled_size[0] > 0 and scaled_size[1] > 0:
-                    text_surface = pygame.transform.scale(text_surface, scaled_size)
-                if self.rotation != 0:
-                    text_surface = pygame.transform.rotate(text_surface, math.degrees(self.rotation))
+            # Cached text, re-rendered only on font, scale or rotation changes
+            text_surface, glow_surface = self.text_surfaces()
             
             # Apply alpha
             text_surface.set_alpha(self.alpha)
@@ -355,16 +507,11 @@ class FloatingIdea:
             # Position and blit
             text_rect = text_surface.get_rect(center=(self.final_x, self.final_y))
             
-            # Add subtle glow effect
-            glow_surface = text_surface.copy()
+            # Add subtle glow effect; glow copies and the text go out in one blits() call
             glow_surface.set_alpha(self.alpha // 3)
-            for dx, dy in [(-2, -2), (-2, 2), (2, -2), (2, 2)]:
-                glow_rect = text_rect.copy()
-                glow_rect.x += dx
-                glow_rect.y += dy
-                screen.blit(glow_surface, glow_rect)
-            
-            screen.blit(text_surface, text_rect)
+            sequence = [(glow_surface, text_rect.move(dx, dy)) for dx, dy in GLOW_OFFSETS]
+            sequence.append((text_surface, text_rect))
+            screen.blits(sequence, doreturn=False)
 
 class InputBox:
     def __init__(self, x, y, width, height, font):
@@ -476,6 +623,16 @@ class PolishedIdeasDisplay:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("✨ Floating Ideas Display - Developer Mode")
         self.clock = pygame.time.Clock()
+        pygame.event.set_blocked(UNUSED_EVENTS)
+        
+        # handle_events dispatches by type; other event types are ignored
+        self.event_handlers = {
+            pygame.QUIT: self.handle_quit,
+            pygame.KEYDOWN: self.handle_key,
+            pygame.MOUSEMOTION: self.handle_mouse,
+            pygame.MOUSEBUTTONDOWN: self.handle_mouse,
+            pygame.MOUSEBUTTONUP: self.handle_mouse,
+        }
         
         # Load fonts
         self.font_loaded = False
@@ -515,7 +672,8 @@ class PolishedIdeasDisplay:
         # Create initial idea font
         self.update_idea_font(36)
         
-        self.ideas: List[FloatingIdea] = []
+        self.idea_pool = IdeaPool()
+        self.ideas: List[FloatingIdea] = self.idea_pool.ideas
         self.running = True
         self.fullscreen = False
         
@@ -526,7 +684,8 @@ class PolishedIdeasDisplay:
         self.submit_button = Button(input_width + 70, input_y, 120, 50, "Add Idea", self.button_font, self.add_current_idea)
         
         # Background particles
-        self.bg_particles = []
+        self.bg_sprites = {radius: make_circle_sprite(radius, BG_PARTICLE_COLOR)
+                           for radius in BG_PARTICLE_RADII}
         self.regenerate_bg_particles()
     
     def update_idea_font(self, size):
@@ -545,16 +704,14 @@ class PolishedIdeasDisplay:
     
     def regenerate_bg_particles(self):
         """Regenerate background particles based on current settings"""
-        self.bg_particles = []
-        for _ in range(int(self.dev_settings.bg_particle_count)):
-            self.bg_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'vx': random.uniform(-0.5, 0.5) * self.dev_settings.bg_particle_speed,
-                'vy': random.uniform(-0.5, 0.5) * self.dev_settings.bg_particle_speed,
-                'size': random.uniform(1, 3),
-                'alpha': random.randint(20, 60)
-            })
+        # One float32 array per property, stepped with whole-array ops
+        count = int(self.dev_settings.bg_particle_count)
+        speed = self.dev_settings.bg_particle_speed
+        self.bg_x = np.random.randint(0, SCREEN_WIDTH + 1, count).astype(np.float32)
+        self.bg_y = np.random.randint(0, SCREEN_HEIGHT + 1, count).astype(np.float32)
+        self.bg_vx = (np.random.uniform(-0.5, 0.5, count) * speed).astype(np.float32)
+        self.bg_vy = (np.random.uniform(-0.5, 0.5, count) * speed).astype(np.float32)
+        self.bg_radius = np.random.uniform(1, 3, count).astype(np.int32)
     
     def add_current_idea(self):
         if self.input_box.text.strip():
@@ -564,7 +721,7 @@ class PolishedIdeasDisplay:
     
     def add_idea(self, text: str):
         while len(self.ideas) >= MAX_IDEAS:
-            self.ideas.pop(0)
+            self.idea_pool.remove(0)
         
         attempts = 0
         while attempts < 20:
@@ -573,8 +730,7 @@ class PolishedIdeasDisplay:
             
             overlap = False
             for existing_idea in self.ideas[-5:]:
-                distance = math.sqrt((x - getattr(existing_idea, 'final_x', existing_idea.x))**2 + 
-                                   (y - getattr(existing_idea, 'final_y', existing_idea.y))**2)
+                distance = math.sqrt((x - existing_idea.final_x)**2 + (y - existing_idea.final_y)**2)
                 if distance < 150:
                     overlap = True
                     break
@@ -583,12 +739,11 @@ class PolishedIdeasDisplay:
                 break
             attempts += 1
         
-        new_idea = FloatingIdea(text, x, y, self.idea_font, self.dev_settings)
-        self.ideas.append(new_idea)
+        FloatingIdea(text, x, y, self.idea_font, self.dev_settings, self.idea_pool)
         print(f"✨ Added idea: '{text}'")
     
     def update(self):
-        # Get current settings from dev panel
+        # Get current settings from dev panel (the same object until a control moves)
         self.dev_settings = self.dev_panel.get_settings()
         
         # Update font size if changed
@@ -598,38 +753,41 @@ class PolishedIdeasDisplay:
             self.last_font_size = current_font_size
         
         # Update background particles if count changed
-        if len(self.bg_particles) != int(self.dev_settings.bg_particle_count):
+        if len(self.bg_x) != int(self.dev_settings.bg_particle_count):
             self.regenerate_bg_particles()
         
-        # Update background particles
-        for particle in self.bg_particles:
-            particle['x'] += particle['vx'] * self.dev_settings.bg_particle_speed
-            particle['y'] += particle['vy'] * self.dev_settings.bg_particle_speed
-            
-            if particle['x'] < 0 or particle['x'] > SCREEN_WIDTH:
-                particle['vx'] *= -1
-            if particle['y'] < 0 or particle['y'] > SCREEN_HEIGHT:
-                particle['vy'] *= -1
+        # Update background particles, reversing any that left the screen
+        speed = self.dev_settings.bg_particle_speed
+        self.bg_x += self.bg_vx * speed
+        self.bg_y += self.bg_vy * speed
+        self.bg_vx[(self.bg_x < 0) | (self.bg_x > SCREEN_WIDTH)] *= -1
+        self.bg_vy[(self.bg_y < 0) | (self.bg_y > SCREEN_HEIGHT)] *= -1
         
         # Update UI
         self.input_box.update()
         
-        # Update ideas with current settings
-        for idea in self.ideas[:]:
-            idea.update(self.dev_settings)
+        # Update ideas with current settings, read once for the whole frame
+        settings = self.dev_settings
+        ctx = (time.time(), settings.speed_multiplier, settings.float_amplitude, settings.bounce_randomness)
+        self.idea_pool.update(ctx)
+        for idea in self.ideas:
+            idea.particles.update()
         
-        self.ideas = [idea for idea in self.ideas if not idea.is_expired()]
+        for slot in reversed(range(len(self.ideas))):
+            if self.ideas[slot].is_expired():
+                self.idea_pool.remove(slot)
     
     def render(self):
         # Use dynamic background color
         self.screen.fill(self.dev_settings.background_color)
         
-        # Render background particles
-        for particle in self.bg_particles:
-            color = (100, 116, 139)  # Keep consistent with original
-            pygame.draw.circle(self.screen, color, 
-                             (int(particle['x']), int(particle['y'])), 
-                             int(particle['size']))
+        # Render background particles from pre-drawn sprites in one blits() call
+        sprites = self.bg_sprites
+        radii = self.bg_radius
+        xs = (self.bg_x.astype(np.int32) - radii - 1).tolist()
+        ys = (self.bg_y.astype(np.int32) - radii - 1).tolist()
+        self.screen.blits([(sprites[radius], (x, y)) for radius, x, y in zip(radii.tolist(), xs, ys)],
+                          doreturn=False)
         
         # Render title
         if not self.ideas:
@@ -667,34 +825,45 @@ class PolishedIdeasDisplay:
         pygame.display.flip()
     
     def handle_events(self):
+        # One unfiltered get() keeps clicks and keys in the order they happened
+        handlers = self.event_handlers
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_F11:
-                    self.toggle_fullscreen()
-                elif event.key == pygame.K_ESCAPE and self.fullscreen:
-                    self.toggle_fullscreen()
-                elif event.key == pygame.K_TAB:
-                    self.dev_panel.toggle_visibility()
-            
-            # Handle developer panel events first (if visible)
-            if self.dev_panel.visible:
-                self.dev_panel.handle_event(event)
-                # If clicking on dev panel, don't handle other UI events
-                if event.type == pygame.MOUSEBUTTONDOWN and self.dev_panel.rect.collidepoint(event.pos):
-                    continue
-            
-            # Handle input box
-            submitted_text = self.input_box.handle_event(event)
-            if submitted_text:
-                self.add_idea(submitted_text)
-                self.input_box.text = ""
-                self.input_box.cursor_pos = 0
-            
-            # Handle button
-            self.submit_button.handle_event(event)
+            handler = handlers.get(event.type)
+            if handler:
+                handler(event)
+    
+    def handle_quit(self, event):
+        self.running = False
+    
+    def handle_key(self, event):
+        if event.key == pygame.K_F11:
+            self.toggle_fullscreen()
+        elif event.key == pygame.K_ESCAPE and self.fullscreen:
+            self.toggle_fullscreen()
+        elif event.key == pygame.K_TAB:
+            self.dev_panel.toggle_visibility()
+        
+        # Handle input box
+        submitted_text = self.input_box.handle_event(event)
+        if submitted_text:
+            self.add_idea(submitted_text)
+            self.input_box.text = ""
+            self.input_box.cursor_pos = 0
+    
+    def handle_mouse(self, event):
+        # Handle developer panel events first (if visible)
+        if self.dev_panel.visible:
+            self.dev_panel.handle_event(event)
+            # If clicking on dev panel, don't handle other UI events
+            if event.type == pygame.MOUSEBUTTONDOWN and self.dev_panel.rect.collidepoint(event.pos):
+                return
+        
+        # Only a click can focus or unfocus the input box
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.input_box.handle_event(event)
+        
+        # Handle button
+        self.submit_button.handle_event(event)
     
     def toggle_fullscreen(self):
         self.fullscreen = not self.fullscreen
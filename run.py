@@ -16,6 +16,7 @@ import sys
 import socket
 import subprocess
 import time
+import importlib.util
 from pathlib import Path
 
 # Optional: QR code support
@@ -198,7 +199,16 @@ def main() -> None:
 
     # Commands
     py = sys.executable or "python"
-    backend_cmd = [py, "-m", "uvicorn", "backend.app:app", "--host", "0.0.0.0", "--port", str(backend_port)]
+    backend_cmd = [
+        py, "-m", "uvicorn", "backend.app:app", "--host", "0.0.0.0", "--port", str(backend_port),
+        # Broadcast frames are zlib-compressed once by the app; skip per-client deflate
+        "--ws-per-message-deflate", "false",
+    ]
+    # Prefer uvloop + httptools when installed (uvloop is unavailable on Windows)
+    if importlib.util.find_spec("uvloop") is not None:
+        backend_cmd += ["--loop", "uvloop"]
+    if importlib.util.find_spec("httptools") is not None:
+        backend_cmd += ["--http", "httptools"]
     streamlit_cmd = [
         py, "-m", "streamlit", "run", "streamlit_app/submit.py",
         "--server.port", str(streamlit_port),
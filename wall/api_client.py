@@ -9,7 +9,7 @@
 # Import typing for hints
 from typing import List, Dict, Any, Callable
 # Import os/json for env + parsing
-import os, json, time, threading, asyncio
+import os, json, time, threading, asyncio, zlib
 # Import requests for REST
 import requests
 # Import websockets for WS client
@@ -34,6 +34,17 @@ class WallState:
         self.on_refresh = on_refresh
 
 
+def decode_frame(msg: bytes | str) -> Dict[str, Any]:
+    """
+    @brief  Decode a backend WS frame: text is plain JSON, binary is zlib-compressed JSON.
+    @param  msg  Raw frame from the socket.
+    @return Parsed message dict.
+    """
+    if isinstance(msg, str):
+        return json.loads(msg)
+    return json.loads(zlib.decompress(msg))
+
+
 class APIClient:
     """
     @brief  Talks to the backend: initial REST fetch, WS live updates, poll fallback.
@@ -90,9 +101,10 @@ class APIClient:
         ws_url = self.base_url.replace("http", "ws") + "/ws"
         while self.running:
             try:
-                async with websockets.connect(ws_url, ping_interval=20) as ws:
+                # Server compresses large frames itself, so skip per-message deflate
+                async with websockets.connect(ws_url, ping_interval=20, compression=None) as ws:
                     async for msg in ws:
-                        payload = json.loads(msg)
+                        payload = decode_frame(msg)
                         t = payload.get("type")
                         if t == "hello":
                             self.state.header = payload["data"].get("header", self.state.header)
@@ -101,6 +113,9 @@ class APIClient:
                         elif t == "idea.new":
                             self.state.ideas.append(payload["data"])
                             self.state.on_refresh()
+                        elif t == "idea.batch":
+                            self.state.ideas.extend(payload["data"])
+                            self.state.on_refresh()
                         elif t == "header.set":
                             self.state.header = payload["data"]
                             self.state.on_refresh()